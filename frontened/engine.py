@@ -1,5 +1,41 @@
 import time
 import random
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:
+    # Numba is optional - the same functions just run as plain Python
+    prange = range
+
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
+
+@njit(cache=True)
+def _calc(cars, trucks, bikes, emergency, min_green_time, max_green_time):
+    """Green time for one reading (compiled core of calculate_duration)"""
+    if emergency:
+        return 10
+    total_time = (cars * 2) + (trucks * 3) + (bikes * 1)
+    if total_time < min_green_time:
+        return min_green_time
+    elif total_time > max_green_time:
+        return max_green_time
+    return total_time
+
+
+@njit(cache=True, parallel=True)
+def _calc_batch(cars, trucks, bikes, emergency, min_green_time, max_green_time):
+    """Green time for arrays of readings, e.g. when replaying logged counts"""
+    durations = np.empty(cars.shape[0], dtype=np.int64)
+    for i in prange(cars.shape[0]):
+        durations[i] = _calc(cars[i], trucks[i], bikes[i], emergency[i],
+                             min_green_time, max_green_time)
+    return durations
+
 
 class SmartTrafficSignal:
     def __init__(self):
@@ -28,6 +64,20 @@ class SmartTrafficSignal:
             "emergency": ambulance
         }
 
+    def simulate_batch(self, n, seed=None):
+        """
+        Draws n simulated camera readings at once with NumPy.
+        Same ranges as detect_vehicles, returned as arrays so the result
+        can go straight into calculate_duration_batch(**batch).
+        """
+        rng = np.random.default_rng(seed)
+        return {
+            "cars": rng.integers(0, 21, n),
+            "trucks": rng.integers(0, 6, n),
+            "bikes": rng.integers(0, 11, n),
+            "emergency": rng.random(n) < 0.2
+        }
+
     def calculate_duration(self, counts):
         """
         [cite_start]Decides how long the green light stays on. [cite: 62]
@@ -40,15 +90,17 @@ class SmartTrafficSignal:
             return 10 # Emergency Mode: Quick pass [cite: 63]
             
         # Logic: 2 seconds per car, 3 per truck, 1 per bike
-        total_time = (counts["cars"] * 2) + (counts["trucks"] * 3) + (counts["bikes"] * 1)
-        
         # [cite_start]Ensure time is within safe limits (min 5s, max 60s) [cite: 64]
-        if total_time < self.min_green_time:
-            return self.min_green_time
-        elif total_time > self.max_green_time:
-            return self.max_green_time
-        
-        return total_time
+        return _calc(counts["cars"], counts["trucks"], counts["bikes"], False,
+                     self.min_green_time, self.max_green_time)
+
+    def calculate_duration_batch(self, cars, trucks, bikes, emergency):
+        """
+        Same rule as calculate_duration over whole arrays of counts.
+        Used for offline replay / tuning runs with thousands of cycles.
+        """
+        return _calc_batch(np.asarray(cars), np.asarray(trucks), np.asarray(bikes),
+                           np.asarray(emergency), self.min_green_time, self.max_green_time)
 
     def run_system(self):
         """
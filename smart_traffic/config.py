@@ -36,6 +36,7 @@ VEHICLE_PROBABILITIES = {
 
 # Display Settings
 FULLSCREEN = True              # Start in fullscreen mode
+GPU_RENDERER = True            # Draw with the SDL2 GPU renderer when available
 FPS = 60                       # Frames per second
 
 # Colors (RGB)
@@ -1,68 +1,96 @@
 import time
+import numpy as np
 from .signal_state import SignalState
 from config import GREEN_LIGHT_DURATION, YELLOW_LIGHT_DURATION
 
+# Signal codes stored in SignalController.signal (bare ints for the hot paths)
+RED, YELLOW, GREEN = int(SignalState.RED), int(SignalState.YELLOW), int(SignalState.GREEN)
+STATES = tuple(SignalState)
+
+# Side name -> index into SignalController.signal
+SIDE_IDX = {"NORTH": 0, "SOUTH": 1, "EAST": 2, "WEST": 3}
+
 class SignalController:
     def __init__(self):
         self.sides = ["NORTH", "SOUTH", "EAST", "WEST"]
         self.current_side_index = 0
         self.current_side = self.sides[0]
         
-        # All signals start as RED
-        self.signals = {
-            "NORTH": SignalState.RED,
-            "SOUTH": SignalState.RED,
-            "EAST": SignalState.RED,
-            "WEST": SignalState.RED
-        }
+        # All signals start as RED (one uint8 code per side, see SIDE_IDX)
+        self.signal = np.zeros(len(self.sides), dtype=np.uint8)
         
         # Set first side to GREEN
-        self.signals[self.current_side] = SignalState.GREEN
+        self.signal[self.current_side_index] = GREEN
         
-        # Timing
-        self.last_change_time = time.time()
+        # Timing (monotonic clock, so wall-clock adjustments can't stall or skip phases)
+        self.now = time.monotonic()
+        self.last_change_time = self.now
         self.green_duration = GREEN_LIGHT_DURATION
         self.yellow_duration = YELLOW_LIGHT_DURATION
         
     def update(self):
-        current_time = time.time()
+        self.tick(time.monotonic())
+    
+    def tick(self, now):
+        """
+        Advance the signal cycle to time `now`
+        
+        The timestamp is kept so the other queries made during the same
+        frame (get_remaining_time) reuse it instead of reading the clock again.
+        
+        Args:
+            now (float): Current time.monotonic() value
+        """
+        self.now = now
+        current_time = now
         elapsed = current_time - self.last_change_time
         
-        current_state = self.signals[self.current_side]
+        current_state = self.signal[self.current_side_index]
         
         # GREEN -> YELLOW transition
-        if current_state == SignalState.GREEN and elapsed >= self.green_duration:
-            self.signals[self.current_side] = SignalState.YELLOW
+        if current_state == GREEN and elapsed >= self.green_duration:
+            self.signal[self.current_side_index] = YELLOW
             self.last_change_time = current_time
             
         # YELLOW -> RED transition, then move to next side
-        elif current_state == SignalState.YELLOW and elapsed >= self.yellow_duration:
-            self.signals[self.current_side] = SignalState.RED
+        elif current_state == YELLOW and elapsed >= self.yellow_duration:
+            self.signal[self.current_side_index] = RED
             
             # Move to next side
             self.current_side_index = (self.current_side_index + 1) % len(self.sides)
             self.current_side = self.sides[self.current_side_index]
             
             # Set next side to GREEN
-            self.signals[self.current_side] = SignalState.GREEN
+            self.signal[self.current_side_index] = GREEN
             self.last_change_time = current_time
     
     def get_signal_state(self, side):
-        return self.signals.get(side, SignalState.RED)
+        index = SIDE_IDX.get(side)
+        if index is None:
+            return SignalState.RED
+        return STATES[self.signal[index]]
     
     def is_green(self, side):
-        return self.signals.get(side) == SignalState.GREEN
+        return self.signal[SIDE_IDX[side]] == GREEN
     
     def is_red(self, side):
-        return self.signals.get(side) == SignalState.RED
+        return self.signal[SIDE_IDX[side]] == RED
+    
+    def get_red_mask(self):
+        """
+        Get red-light flags for all sides at once
+        
+        Returns:
+            numpy.ndarray: Boolean array indexed by SIDE_IDX
+        """
+        return self.signal == RED
     
     def get_remaining_time(self):
-        current_time = time.time()
-        elapsed = current_time - self.last_change_time
+        elapsed = self.now - self.last_change_time
         
-        current_state = self.signals[self.current_side]
-        if current_state == SignalState.GREEN:
+        current_state = self.signal[self.current_side_index]
+        if current_state == GREEN:
             return max(0, self.green_duration - elapsed)
-        elif current_state == SignalState.YELLOW:
+        elif current_state == YELLOW:
             return max(0, self.yellow_duration - elapsed)
         return 0
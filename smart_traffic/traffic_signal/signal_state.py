@@ -1,9 +1,11 @@
-from enum import Enum
+from enum import IntEnum
 
-class SignalState(Enum):
-    RED = "RED"
-    YELLOW = "YELLOW"
-    GREEN = "GREEN"
+class SignalState(IntEnum):
+    # Integer values so state checks are plain int compares and the
+    # controller can store states directly in its uint8 array
+    RED = 0
+    YELLOW = 1
+    GREEN = 2
     
     def __str__(self):
-        return self.value
+        return self.name
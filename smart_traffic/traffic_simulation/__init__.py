@@ -1,5 +1,6 @@
 from .vehicle import Vehicle
+from .vehicle_fleet import VehicleFleet
 from .traffic_generator import TrafficGenerator
 from .intersection import Intersection
 
-__all__ = ['Vehicle', 'TrafficGenerator', 'Intersection']
+__all__ = ['Vehicle', 'VehicleFleet', 'TrafficGenerator', 'Intersection']
@@ -3,7 +3,10 @@ Intersection Module
 Manages the 4-sided intersection and all vehicles
 """
 
+import time
 from .traffic_generator import TrafficGenerator
+from .vehicle import SIDES
+from .vehicle_fleet import VehicleFleet
 
 class Intersection:
     """
@@ -20,15 +23,8 @@ class Intersection:
         self.signal_controller = signal_controller
         self.traffic_generator = TrafficGenerator()
         
-        # Store vehicles for each side
-        self.vehicles = {
-            "NORTH": [],
-            "SOUTH": [],
-            "EAST": [],
-            "WEST": []
-        }
-        
-        self.window_size = (1920, 1080)
+        # All vehicles, stored as parallel arrays
+        self.fleet = VehicleFleet()
         
         # Statistics
         self.total_vehicles_crossed = 0
@@ -36,53 +32,36 @@ class Intersection:
     
     def set_window_size(self, width, height):
         """Update window size for vehicle positioning"""
-        self.window_size = (width, height)
+        self.fleet.set_window_size(width, height)
     
     def update(self):
         """Update intersection - generate vehicles and move them"""
-        # Update signal controller
-        self.signal_controller.update()
+        # Update signal controller (one clock read per frame)
+        self.signal_controller.tick(time.monotonic())
         
         # Generate new vehicles for each side
-        for side in self.vehicles.keys():
-            new_vehicle = self.traffic_generator.generate_vehicle(
-                side, 
-                len(self.vehicles[side])
+        for side in SIDES:
+            self.traffic_generator.generate_vehicle(
+                self.fleet,
+                side,
+                self.fleet.count_side(side)
             )
-            if new_vehicle:
-                new_vehicle.update_position_for_screen(self.window_size)
-                self.vehicles[side].append(new_vehicle)
         
-        # Move vehicles based on signal state
-        for side in self.vehicles.keys():
-            signal_is_red = self.signal_controller.is_red(side)
-            
-            for i, vehicle in enumerate(self.vehicles[side]):
-                # Get vehicles ahead of this one
-                vehicles_ahead = self.vehicles[side][:i]
-                
-                # Check if vehicle should stop at red light or behind another vehicle
-                if vehicle.should_stop(signal_is_red, vehicles_ahead, self.window_size):
-                    continue  # Don't move
-                else:
-                    vehicle.move(self.window_size)  # Move forward
+        # Move vehicles based on signal state (all four red flags in one compare)
+        red_mask = self.signal_controller.get_red_mask()
+        stop = self.fleet.stop_mask(red_mask)
+        self.fleet.move_all(~stop)
         
         # Remove vehicles that have crossed and update statistics
         self._remove_crossed_vehicles()
     
     def _remove_crossed_vehicles(self):
         """Remove vehicles that have completely crossed the intersection"""
-        for side in self.vehicles.keys():
-            before_count = len(self.vehicles[side])
-            
-            # Count crossed vehicles by type before removing
-            for v in self.vehicles[side]:
-                if v.crossed:
-                    self.total_vehicles_crossed += 1
-                    self.vehicles_crossed_by_type[v.vehicle_type] += 1
-            
-            # Remove crossed vehicles
-            self.vehicles[side] = [v for v in self.vehicles[side] if not v.crossed]
+        for vehicle_type, count in self.fleet.remove_crossed().items():
+            self.total_vehicles_crossed += count
+            self.vehicles_crossed_by_type[vehicle_type] = (
+                self.vehicles_crossed_by_type.get(vehicle_type, 0) + count
+            )
     
     def get_all_vehicles(self):
         """
@@ -91,10 +70,16 @@ class Intersection:
         Returns:
             list: List of all Vehicle objects
         """
-        all_vehicles = []
-        for vehicles_list in self.vehicles.values():
-            all_vehicles.extend(vehicles_list)
-        return all_vehicles
+        return self.fleet.get_vehicles()
+    
+    def get_visible_vehicles(self):
+        """
+        Get the vehicles that are inside the window (for drawing)
+        
+        Returns:
+            list: List of Vehicle objects
+        """
+        return self.fleet.get_vehicles(self.fleet.on_screen())
     
     def get_vehicle_count(self, side):
         """
@@ -106,8 +91,8 @@ class Intersection:
         Returns:
             int: Number of vehicles
         """
-        return len(self.vehicles[side])
+        return self.fleet.count_side(side)
     
     def get_total_vehicle_count(self):
         """Get total number of vehicles currently in system"""
-        return sum(len(vehicles) for vehicles in self.vehicles.values())
+        return self.fleet.count
@@ -1,5 +1,6 @@
 import random
-from .vehicle import Vehicle
+import bisect
+import itertools
 import config
 
 class TrafficGenerator:
@@ -10,14 +11,32 @@ class TrafficGenerator:
         self.max_vehicles = config.MAX_VEHICLES_PER_SIDE
         self.vehicle_types = list(config.VEHICLE_PROBABILITIES.keys())
         self.probabilities = list(config.VEHICLE_PROBABILITIES.values())
+        
+        # Cumulative weights built once (random.choices rebuilds them per call)
+        self.cum_weights = list(itertools.accumulate(self.probabilities))
+        self.total_weight = self.cum_weights[-1]
     
     def should_generate_vehicle(self):
         return random.random() < self.spawn_rate
     
     def choose_vehicle_type(self):
-        return random.choices(self.vehicle_types, weights=self.probabilities)[0]
+        # Same draw as random.choices(self.vehicle_types, weights=...)
+        index = bisect.bisect(self.cum_weights, random.random() * self.total_weight,
+                              0, len(self.cum_weights) - 1)
+        return self.vehicle_types[index]
     
-    def generate_vehicle(self, side, current_vehicle_count):
+    def generate_vehicle(self, fleet, side, current_vehicle_count):
+        """
+        Maybe spawn a vehicle at the back of a side's queue
+        
+        Args:
+            fleet (VehicleFleet): Fleet the vehicle is added to
+            side (str): Side name
+            current_vehicle_count (int): Vehicles already on that side
+            
+        Returns:
+            int: Fleet index of the new vehicle, or None
+        """
         # Don't generate if too many vehicles already
         if current_vehicle_count >= self.max_vehicles:
             return None
@@ -30,5 +49,4 @@ class TrafficGenerator:
         vehicle_type = self.choose_vehicle_type()
         
         # Create vehicle at back of queue
-        vehicle = Vehicle(side, current_vehicle_count, vehicle_type)
-        return vehicle
+        return fleet.spawn(side, current_vehicle_count, vehicle_type)
@@ -0,0 +1,399 @@
+"""
+Vehicle Fleet Module
+Stores every vehicle of the intersection as parallel NumPy arrays
+(structure of arrays) so the per-frame update runs as array operations
+"""
+
+import random
+import numpy as np
+import config
+from .vehicle import Vehicle, SIDES, SIDE_ID, VEHICLE_TYPES, TYPE_ID
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    # Numba is optional - move_all then uses the NumPy array operations
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
+# Unit step of a vehicle heading away from each side. The same signs give
+# its position along the approach axis (grows as the vehicle advances)
+DX = np.array([0, 0, -1, 1])
+DY = np.array([1, -1, 0, 0])
+
+# Side after a turn, indexed [turn_direction, side]
+# (0=straight, 1=left: N->W S->E E->N W->S, 2=right: N->E S->W E->S W->N)
+TURN = np.array([
+    [0, 1, 2, 3],
+    [3, 2, 0, 1],
+    [2, 3, 1, 0]
+])
+
+# Lane offset from the intersection center across the approach axis
+LANE_X = np.array([-80, 80, 0, 0])
+LANE_Y = np.array([0, 0, 80, -80])
+
+
+@njit(parallel=True, cache=True)
+def _move_kernel(x, y, speed, side_id, orig_side_id, turn_direction,
+                 is_turning, crossed, crossed_signal, moving, axis_center):
+    """
+    Compiled core of VehicleFleet.move_all (same rules as preview_move and
+    check_crossed_all, one vehicle per loop iteration)
+    """
+    for i in prange(x.shape[0]):
+        if not moving[i] or crossed[i]:
+            continue
+        orig = orig_side_id[i]
+        side = side_id[i]
+        
+        # Start turning when reaching the intersection center
+        from_center = DX[orig] * x[i] + DY[orig] * y[i] - axis_center[orig]
+        if not is_turning[i] and abs(from_center) < 30:
+            side = TURN[turn_direction[i], side]
+            side_id[i] = side
+            is_turning[i] = True
+        
+        # Move in current direction
+        x[i] += DX[side] * speed[i]
+        y[i] += DY[side] * speed[i]
+        
+        # Completely crossed / crossed the signal line of its own side
+        if DX[side] * x[i] + DY[side] * y[i] - axis_center[side] > 400:
+            crossed[i] = True
+        if DX[orig] * x[i] + DY[orig] * y[i] - axis_center[orig] > -150:
+            crossed_signal[i] = True
+
+
+class VehicleFleet:
+    """
+    All vehicles of the intersection in spawn order, one array per attribute
+    """
+    
+    # Per-vehicle arrays, grown and compacted together
+    ARRAYS = {
+        "x": np.float64,
+        "y": np.float64,
+        "speed": np.float64,
+        "side_id": np.int8,
+        "orig_side_id": np.int8,
+        "type_id": np.int8,
+        "position": np.int16,
+        "width": np.int16,
+        "height": np.int16,
+        "turn_direction": np.int8,
+        "is_turning": np.bool_,
+        "crossed": np.bool_,
+        "crossed_signal": np.bool_
+    }
+    
+    def __init__(self, capacity=64, window_size=(1920, 1080)):
+        """
+        Initialize an empty fleet
+        
+        Args:
+            capacity (int): Initial array size (doubles when full)
+            window_size (tuple): Initial window size
+        """
+        self.window_width = self.window_height = None
+        self.set_window_size(*window_size)
+        
+        self.count = 0
+        self.capacity = capacity
+        for name, dtype in self.ARRAYS.items():
+            setattr(self, name, np.zeros(capacity, dtype=dtype))
+        
+        # License plates stay a Python list (strings), same order as the arrays
+        self.plates = []
+    
+    def set_window_size(self, width, height):
+        """
+        Recompute the intersection center (only changes on window resize)
+        
+        Args:
+            width (int): Window width
+            height (int): Window height
+        """
+        if width == self.window_width and height == self.window_height:
+            return
+        
+        self.window_width = width
+        self.window_height = height
+        self.center_x = width // 2
+        self.center_y = height // 2
+        
+        # Travel position of the center along each side's axis
+        self.axis_center = DX * self.center_x + DY * self.center_y
+    
+    def _grow(self):
+        """Double the capacity of every array"""
+        self.capacity *= 2
+        for name in self.ARRAYS:
+            old = getattr(self, name)
+            new = np.zeros(self.capacity, dtype=old.dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+    
+    def spawn(self, side, position, vehicle_type):
+        """
+        Add a vehicle at the back of a side's queue
+        
+        Args:
+            side (str): Side the vehicle comes from
+            position (int): Place in that side's queue
+            vehicle_type (str): CAR, TRUCK or BUS
+        
+        Returns:
+            int: Index of the new vehicle
+        """
+        if self.count == self.capacity:
+            self._grow()
+        
+        i = self.count
+        self.count += 1
+        
+        side_id = SIDE_ID[side]
+        self.side_id[i] = side_id
+        self.orig_side_id[i] = side_id
+        self.type_id[i] = TYPE_ID[vehicle_type]
+        self.position[i] = position
+        self.speed[i] = config.VEHICLE_SPEED
+        self.width[i], self.height[i] = config.VEHICLE_SIZES.get(vehicle_type, (60, 35))
+        self.is_turning[i] = False
+        self.crossed[i] = False
+        self.crossed_signal[i] = False
+        
+        self.plates.append(Vehicle.generate_license_plate())
+        
+        # Random direction: 0=straight, 1=left, 2=right
+        self.turn_direction[i] = random.choice([0, 0, 0, 1, 2])  # 60% straight, 20% left, 20% right
+        
+        # Start behind the stop line, spaced by queue position
+        spacing = 60  # Space between vehicles
+        behind = 300 + position * spacing
+        self.x[i] = self.center_x + LANE_X[side_id] - DX[side_id] * behind
+        self.y[i] = self.center_y + LANE_Y[side_id] - DY[side_id] * behind
+        
+        return i
+    
+    def travel_position(self, x, y, orig_side_id):
+        """
+        Position along each vehicle's approach axis
+        
+        The gap to a vehicle ahead in the same lane is simply the difference
+        of their travel positions.
+        """
+        return DX[orig_side_id] * x + DY[orig_side_id] * y
+    
+    def preview_move(self):
+        """
+        State every vehicle would have after moving one step this frame
+        
+        Returns:
+            tuple: (x, y, side_id, is_turning) arrays after the move
+        """
+        n = self.count
+        x, y = self.x[:n], self.y[:n]
+        side_id = self.side_id[:n]
+        orig_side_id = self.orig_side_id[:n]
+        
+        # Start turning when reaching the intersection center
+        from_center = (self.travel_position(x, y, orig_side_id) -
+                       self.axis_center[orig_side_id])
+        turn_now = ~self.is_turning[:n] & (np.abs(from_center) < 30)
+        new_side = np.where(turn_now, TURN[self.turn_direction[:n], side_id], side_id)
+        
+        # Move in current direction
+        speed = self.speed[:n]
+        return (x + DX[new_side] * speed,
+                y + DY[new_side] * speed,
+                new_side.astype(np.int8),
+                self.is_turning[:n] | turn_now)
+    
+    def move_all(self, moving):
+        """
+        Move the selected vehicles one step and update their crossing flags
+        
+        Args:
+            moving (numpy.ndarray): Boolean mask of vehicles that move
+        """
+        n = self.count
+        if NUMBA_AVAILABLE:
+            _move_kernel(self.x[:n], self.y[:n], self.speed[:n], self.side_id[:n],
+                         self.orig_side_id[:n], self.turn_direction[:n],
+                         self.is_turning[:n], self.crossed[:n], self.crossed_signal[:n],
+                         moving, self.axis_center)
+            return
+        
+        moving = moving & ~self.crossed[:n]
+        new_x, new_y, new_side, new_turning = self.preview_move()
+        
+        self.x[:n] = np.where(moving, new_x, self.x[:n])
+        self.y[:n] = np.where(moving, new_y, self.y[:n])
+        self.side_id[:n] = np.where(moving, new_side, self.side_id[:n])
+        self.is_turning[:n] = np.where(moving, new_turning, self.is_turning[:n])
+        
+        self.check_crossed_all(moving)
+    
+    def check_crossed_all(self, moved):
+        """
+        Update crossed / crossed_signal flags of vehicles that just moved
+        
+        Args:
+            moved (numpy.ndarray): Boolean mask of vehicles that moved
+        """
+        n = self.count
+        x, y = self.x[:n], self.y[:n]
+        
+        # Completely crossed: 400px past the center in the current direction
+        side_id = self.side_id[:n]
+        past_center = (self.travel_position(x, y, side_id) -
+                       self.axis_center[side_id])
+        self.crossed[:n] |= moved & (past_center > 400)
+        
+        # Crossed the signal line (150px before the center) of its own side
+        orig_side_id = self.orig_side_id[:n]
+        from_center = (self.travel_position(x, y, orig_side_id) -
+                       self.axis_center[orig_side_id])
+        self.crossed_signal[:n] |= moved & (from_center > -150)
+    
+    def stop_mask(self, red_mask):
+        """
+        Decide which vehicles stop this frame
+        
+        A vehicle that has not passed its signal line stops when the signal
+        is red and it reached the stop line, or when it would get closer
+        than 50px to the vehicles ahead of it (after those moved).
+        
+        Args:
+            red_mask (numpy.ndarray): Red-light flag per side id
+        
+        Returns:
+            numpy.ndarray: Boolean mask of stopping vehicles
+        """
+        n = self.count
+        orig_side_id = self.orig_side_id[:n]
+        crossed_signal = self.crossed_signal[:n]
+        
+        travel = self.travel_position(self.x[:n], self.y[:n], orig_side_id)
+        from_center = travel - self.axis_center[orig_side_id]
+        stop_for_signal = red_mask[orig_side_id] & (from_center >= -160)
+        
+        new_x, new_y, _, _ = self.preview_move()
+        moved_travel = self.travel_position(new_x, new_y, orig_side_id)
+        
+        stop = np.zeros(n, dtype=bool)
+        for side_id in range(len(SIDES)):
+            lane = np.flatnonzero(orig_side_id == side_id)  # in queue order
+            if lane.size:
+                stop[lane] = self._lane_stop(travel[lane], moved_travel[lane],
+                                             stop_for_signal[lane], crossed_signal[lane])
+        
+        return stop
+    
+    def _lane_stop(self, travel, moved_travel, stop_for_signal, crossed_signal):
+        """
+        Stop decisions for one lane, vectorized
+        
+        The nearest vehicle ahead is the minimum end-of-frame travel position
+        over the vehicles queued before this one (exclusive prefix minimum),
+        and that depends on whether those vehicles stopped. Decisions are
+        re-evaluated until they no longer change; every pass settles at least
+        one more vehicle from the front, and in practice it takes 2-3 passes.
+        
+        Args:
+            travel (numpy.ndarray): Current travel positions, in queue order
+            moved_travel (numpy.ndarray): Travel positions after a step
+            stop_for_signal (numpy.ndarray): Red light and at the stop line
+            crossed_signal (numpy.ndarray): Already past the signal line
+            
+        Returns:
+            numpy.ndarray: Boolean stop mask for the lane
+        """
+        may_stop = ~crossed_signal
+        stop = may_stop & stop_for_signal
+        nearest_ahead = np.empty_like(travel)
+        nearest_ahead[0] = np.inf
+        
+        while True:
+            end_position = np.where(stop, travel, moved_travel)
+            np.minimum.accumulate(end_position[:-1], out=nearest_ahead[1:])
+            
+            blocked = nearest_ahead - travel < 50  # Minimum distance to maintain
+            new_stop = may_stop & (blocked | stop_for_signal)
+            if np.array_equal(new_stop, stop):
+                return stop
+            stop = new_stop
+    
+    def remove_crossed(self):
+        """
+        Drop vehicles that have crossed, keeping the rest in order
+        
+        Returns:
+            dict: Number of removed vehicles by type
+        """
+        n = self.count
+        crossed = self.crossed[:n]
+        removed = np.bincount(self.type_id[:n][crossed], minlength=len(VEHICLE_TYPES))
+        
+        if removed.any():
+            keep = ~crossed
+            kept = int(keep.sum())
+            for name in self.ARRAYS:
+                array = getattr(self, name)
+                array[:kept] = array[:n][keep]
+            self.plates = [plate for plate, k in zip(self.plates, keep) if k]
+            self.count = kept
+        
+        return {vehicle_type: int(c) for vehicle_type, c in zip(VEHICLE_TYPES, removed)}
+    
+    def count_side(self, side):
+        """
+        Number of vehicles that came from a side
+        
+        Args:
+            side (str): Side name
+        
+        Returns:
+            int: Number of vehicles
+        """
+        return int(np.count_nonzero(self.orig_side_id[:self.count] == SIDE_ID[side]))
+    
+    def on_screen(self):
+        """
+        Vehicles whose body overlaps the window
+        
+        Queued vehicles far up the approach roads are outside the window on
+        smaller screens and need no drawing.
+        
+        Returns:
+            numpy.ndarray: Boolean mask over the fleet
+        """
+        n = self.count
+        x, y = self.x[:n], self.y[:n]
+        margin = max(max(size) for size in config.VEHICLE_SIZES.values()) // 2
+        return ((x > -margin) & (x < self.window_width + margin) &
+                (y > -margin) & (y < self.window_height + margin))
+    
+    def get_vehicles(self, mask=None):
+        """
+        Views of all vehicles, grouped by the side they came from
+        
+        Args:
+            mask (numpy.ndarray): Only include these vehicles (default: all)
+        
+        Returns:
+            list: Vehicle views (valid until the fleet is next updated)
+        """
+        if mask is None:
+            indices = np.arange(self.count)
+        else:
+            indices = np.flatnonzero(mask)
+        order = indices[np.argsort(self.orig_side_id[indices], kind="stable")]
+        return [Vehicle(self, int(i)) for i in order]
@@ -2,20 +2,43 @@ import pygame
 import config
 from traffic_signal import SignalState
 
+try:
+    from pygame._sdl2 import error as SDLError
+    from pygame._sdl2.video import Window, Renderer, Texture
+except ImportError:
+    # pygame without the SDL2 render API - software blitting only
+    Renderer = None
+
+# Maximum number of cached text surfaces before the cache is reset
+TEXT_CACHE_LIMIT = 512
+
+# Maximum number of GPU textures (one per cached surface) before reset
+TEXTURE_CACHE_LIMIT = 3 * TEXT_CACHE_LIMIT
+
+# Transparent color of the (opaque) vehicle sprites - not used by any drawing
+SPRITE_COLORKEY = (255, 0, 255)
+
+
+def _darken(color, amount):
+    """Darker shade of an RGB color, clamped at 0 (used when baking sprites)"""
+    return tuple(max(0, c - amount) for c in color)
+
+
 class TrafficDisplay:
     def __init__(self):
         """Initialize Pygame display"""
         pygame.init()
+        self.fullscreen = config.FULLSCREEN
         
-        if config.FULLSCREEN:
-            self.screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
-        else:
-            # Windowed mode
-            info = pygame.display.Info()
-            self.screen = pygame.display.set_mode((info.current_w - 100, info.current_h - 100))
+        # GPU renderer (textures) when available, else the display surface
+        self.screen = None
+        self.window = None
+        self.renderer = self._create_renderer()
+        
+        # Textures of the cached surfaces, keyed by surface (GPU renderer only)
+        self.textures = {}
         
-        self.width = self.screen.get_width()
-        self.height = self.screen.get_height()
+        self._set_mode()
         
         pygame.display.set_caption("Smart Traffic Signal Simulation")
         self.clock = pygame.time.Clock()
@@ -25,20 +48,113 @@ class TrafficDisplay:
         self.font_medium = pygame.font.Font(None, 32)
         self.font_small = pygame.font.Font(None, 24)
         self.font_vehicle_id = pygame.font.Font(None, 20)
+        self.font_plate = pygame.font.Font(None, 14)
         
-        self.fullscreen = config.FULLSCREEN
+        # Rendered text surfaces, keyed by (font, text, color)
+        self.text_cache = {}
+        
+        # Vehicle body sprites, keyed by (type, color, w, h, is_vertical)
+        self.sprite_cache = {}
+        
+        # License plate sprites, keyed by plate number
+        self.plate_cache = {}
+        
+        # Static scene (background, title, roads), rebuilt when the size changes
+        self.background = None
+        
+        # Signal sprites (box, light, ring and side label), keyed by (side, state)
+        self.signal_sprites = {}
+        
+        # Semi-transparent statistics panel background
+        self.stats_panel = self._create_stats_panel()
+        
+        # Screen areas drawn over the background this frame and last frame
+        # (only these are restored and sent to the display)
+        self.dirty_rects = []
+        self.last_dirty_rects = []
+    
+    def _create_renderer(self):
+        """
+        Open the window with a hardware-accelerated SDL2 renderer
+        
+        Returns:
+            Renderer: GPU renderer, or None to use the software display surface
+        """
+        if not config.GPU_RENDERER or Renderer is None:
+            return None
+        
+        info = pygame.display.Info()
+        self.window = Window("Smart Traffic Signal Simulation",
+                             (info.current_w - 100, info.current_h - 100))
+        try:
+            return Renderer(self.window, accelerated=1)
+        except SDLError:
+            # No accelerated driver (e.g. no GPU) - the SDL software
+            # renderer would be no faster than blitting
+            self.window.destroy()
+            self.window = None
+            return None
+    
+    def _set_mode(self):
+        """Apply the fullscreen setting and update the layout"""
+        if self.renderer is not None:
+            if self.fullscreen:
+                self.window.set_fullscreen(desktop=True)
+            else:
+                self.window.set_windowed()
+            self.width, self.height = self.window.size
+        else:
+            if self.fullscreen:
+                self.screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+            else:
+                # Windowed mode
+                info = pygame.display.Info()
+                self.screen = pygame.display.set_mode((info.current_w - 100, info.current_h - 100))
+            self.width = self.screen.get_width()
+            self.height = self.screen.get_height()
+        self._recompute_layout()
     
     def toggle_fullscreen(self):
         """Toggle between fullscreen and windowed mode"""
         self.fullscreen = not self.fullscreen
-        if self.fullscreen:
-            self.screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
-        else:
-            info = pygame.display.Info()
-            self.screen = pygame.display.set_mode((info.current_w - 100, info.current_h - 100))
-        
-        self.width = self.screen.get_width()
-        self.height = self.screen.get_height()
+        self._set_mode()
+        self.background = None
+        self.stats_panel = self._create_stats_panel()
+    
+    def _recompute_layout(self):
+        """Screen coordinates that only change with the window size"""
+        self.cx = self.width // 2
+        self.cy = self.height // 2
+        
+        # Road edges
+        road_half = config.ROAD_WIDTH // 2
+        self.road_left = self.cx - road_half
+        self.road_right = self.cx + road_half
+        self.road_top = self.cy - road_half
+        self.road_bottom = self.cy + road_half
+        
+        # Signal centers
+        offset = 120
+        self.signal_positions = {
+            "NORTH": (self.cx - 50, self.cy - offset),
+            "SOUTH": (self.cx + 50, self.cy + offset),
+            "EAST": (self.cx + offset, self.cy + 50),
+            "WEST": (self.cx - offset, self.cy - 50)
+        }
+    
+    def _build_background(self):
+        """Render the parts of the scene that never change into one surface"""
+        self.textures.pop(self.background, None)
+        self.background = self._convert(pygame.Surface((self.width, self.height)), alpha=False)
+        
+        screen = self.screen
+        self.screen = self.background
+        try:
+            self.screen.fill(config.COLOR_BACKGROUND)
+            self._draw_title()
+            self._draw_roads()
+        finally:
+            self.screen = screen
     
     def draw(self, intersection):
         """
@@ -47,23 +163,29 @@ class TrafficDisplay:
         Args:
             intersection (Intersection): The intersection to draw
         """
-        # Update intersection window size
+        # Update intersection window size (no-op unless the window was resized)
         intersection.set_window_size(self.width, self.height)
         
-        # Clear screen
-        self.screen.fill(config.COLOR_BACKGROUND)
-        
-        # Draw title
-        self._draw_title()
-        
-        # Draw roads
-        self._draw_roads()
+        # Clear screen, title and roads (pre-rendered). After the first
+        # frame only the areas drawn over last frame need restoring
+        full_update = self.background is None or self.background.get_size() != (self.width, self.height)
+        if full_update:
+            self._build_background()
+        if self.renderer is not None:
+            # The GPU redraws the whole frame from textures
+            self._get_texture(self.background).draw()
+        elif full_update:
+            self.screen.blit(self.background, (0, 0))
+        else:
+            for rect in self.last_dirty_rects:
+                self.screen.blit(self.background, rect, rect)
+        self.dirty_rects = []
         
         # Draw traffic signals
         self._draw_signals(intersection.signal_controller)
         
         # Draw vehicles with IDs
-        self._draw_vehicles(intersection.get_all_vehicles())
+        self._draw_vehicles(intersection.get_visible_vehicles())
         
         # Draw statistics
         self._draw_statistics(intersection)
@@ -71,47 +193,121 @@ class TrafficDisplay:
         # Draw controls help
         self._draw_controls()
         
-        # Update display
-        pygame.display.flip()
+        # Update display (only the changed areas)
+        if self.renderer is not None:
+            self.renderer.present()
+        elif full_update:
+            pygame.display.flip()
+        else:
+            pygame.display.update(self.last_dirty_rects + self.dirty_rects)
+        self.last_dirty_rects = self.dirty_rects
         self.clock.tick(config.FPS)
     
+    def _convert(self, surface, alpha=True):
+        """
+        Convert a baked surface to the display pixel format for fast blits
+        (the GPU renderer uploads surfaces as textures instead)
+        """
+        if self.renderer is not None:
+            return surface
+        return surface.convert_alpha() if alpha else surface.convert()
+    
+    def _get_texture(self, surface):
+        """
+        GPU texture of a cached surface, uploaded on first use
+        
+        Args:
+            surface (pygame.Surface): Surface from one of the caches
+            
+        Returns:
+            Texture: Texture with the surface's colorkey/alpha applied
+        """
+        texture = self.textures.get(surface)
+        if texture is None:
+            if len(self.textures) >= TEXTURE_CACHE_LIMIT:
+                self.textures.clear()
+            texture = Texture.from_surface(self.renderer, surface)
+            self.textures[surface] = texture
+        return texture
+    
+    def _blit(self, surface, pos):
+        """
+        Draw a surface on the screen for this frame
+        
+        Args:
+            surface (pygame.Surface): Surface to draw
+            pos (tuple): Top-left position
+            
+        Returns:
+            pygame.Rect: Area drawn (also added to the dirty rects)
+        """
+        if self.renderer is None:
+            rect = self.screen.blit(surface, pos)
+        else:
+            rect = pygame.Rect(pos, surface.get_size())
+            self._get_texture(surface).draw(dstrect=rect)
+        self.dirty_rects.append(rect)
+        return rect
+    
+    def _text(self, font, text, color):
+        """
+        Render text once and reuse the surface on later frames
+        
+        Args:
+            font (pygame.font.Font): Font to render with
+            text (str): Text to render
+            color (tuple): Text color
+            
+        Returns:
+            pygame.Surface: Rendered text
+        """
+        key = (font, text, color)
+        surface = self.text_cache.get(key)
+        if surface is None:
+            # Changing timer and count strings keep adding entries
+            if len(self.text_cache) >= TEXT_CACHE_LIMIT:
+                self.text_cache.clear()
+            surface = font.render(text, True, color)
+            self.text_cache[key] = surface
+        return surface
+    
     def _draw_title(self):
         """Draw title at top of screen"""
-        title = self.font_large.render("Smart Traffic Signal Simulation", True, config.COLOR_TEXT)
-        self.screen.blit(title, (self.width // 2 - title.get_width() // 2, 20))
+        title = self._text(self.font_large, "Smart Traffic Signal Simulation", config.COLOR_TEXT)
+        self.screen.blit(title, (self.cx - title.get_width() // 2, 20))
     
     def _draw_roads(self):
         """Draw the intersection roads"""
-        center_x = self.width // 2
-        center_y = self.height // 2
         road_width = config.ROAD_WIDTH
         
         # Vertical road
         pygame.draw.rect(
             self.screen, 
             config.COLOR_ROAD,
-            (center_x - road_width//2, 0, road_width, self.height)
+            (self.road_left, 0, road_width, self.height)
         )
         
         # Horizontal road
         pygame.draw.rect(
             self.screen,
             config.COLOR_ROAD,
-            (0, center_y - road_width//2, self.width, road_width)
+            (0, self.road_top, self.width, road_width)
         )
         
         # Draw center lines and stop lines
-        self._draw_road_markings(center_x, center_y, road_width)
+        self._draw_road_markings()
     
-    def _draw_road_markings(self, center_x, center_y, road_width):
+    def _draw_road_markings(self):
         """Draw road markings, center lines, and stop lines"""
+        center_x = self.cx
+        center_y = self.cy
         line_width = 4
         dash_length = 30
         dash_gap = 20
         
         # Vertical center line (dashed)
         for y in range(0, self.height, dash_length + dash_gap):
-            if y < center_y - road_width//2 or y > center_y + road_width//2:
+            if y < self.road_top or y > self.road_bottom:
                 pygame.draw.line(
                     self.screen,
                     config.COLOR_ROAD_LINE,
@@ -122,7 +318,7 @@ class TrafficDisplay:
         
         # Horizontal center line (dashed)
         for x in range(0, self.width, dash_length + dash_gap):
-            if x < center_x - road_width//2 or x > center_x + road_width//2:
+            if x < self.road_left or x > self.road_right:
                 pygame.draw.line(
                     self.screen,
                     config.COLOR_ROAD_LINE,
@@ -138,7 +334,7 @@ class TrafficDisplay:
         # North stop line
         pygame.draw.line(
             self.screen, config.COLOR_ROAD_MARKING,
-            (center_x - road_width//2 + 10, center_y - stop_offset),
+            (self.road_left + 10, center_y - stop_offset),
             (center_x, center_y - stop_offset),
             stop_line_width
         )
@@ -147,7 +343,7 @@ class TrafficDisplay:
         pygame.draw.line(
             self.screen, config.COLOR_ROAD_MARKING,
             (center_x, center_y + stop_offset),
-            (center_x + road_width//2 - 10, center_y + stop_offset),
+            (self.road_right - 10, center_y + stop_offset),
             stop_line_width
         )
         
@@ -155,70 +351,102 @@ class TrafficDisplay:
         pygame.draw.line(
             self.screen, config.COLOR_ROAD_MARKING,
             (center_x + stop_offset, center_y),
-            (center_x + stop_offset, center_y + road_width//2 - 10),
+            (center_x + stop_offset, self.road_bottom - 10),
             stop_line_width
         )
         
         # West stop line
         pygame.draw.line(
             self.screen, config.COLOR_ROAD_MARKING,
-            (center_x - stop_offset, center_y - road_width//2 + 10),
+            (center_x - stop_offset, self.road_top + 10),
             (center_x - stop_offset, center_y),
             stop_line_width
         )
     
     def _draw_signals(self, signal_controller):
         """Draw traffic signals for each side"""
-        center_x = self.width // 2
-        center_y = self.height // 2
-        offset = 120
-        
-        signal_positions = {
-            "NORTH": (center_x - 50, center_y - offset),
-            "SOUTH": (center_x + 50, center_y + offset),
-            "EAST": (center_x + offset, center_y + 50),
-            "WEST": (center_x - offset, center_y - 50)
-        }
-        
-        for side, pos in signal_positions.items():
+        for side, pos in self.signal_positions.items():
             state = signal_controller.get_signal_state(side)
             
-            # Choose color based on state
-            if state == SignalState.RED:
-                color = config.COLOR_SIGNAL_RED
-            elif state == SignalState.YELLOW:
-                color = config.COLOR_SIGNAL_YELLOW
-            else:  # GREEN
-                color = config.COLOR_SIGNAL_GREEN
-            
-            # Draw signal background (black box)
-            signal_rect = pygame.Rect(pos[0] - 25, pos[1] - 40, 50, 80)
-            pygame.draw.rect(self.screen, (0, 0, 0), signal_rect, border_radius=10)
-            
-            # Draw signal light
-            pygame.draw.circle(self.screen, color, pos, config.SIGNAL_SIZE)
-            pygame.draw.circle(self.screen, (255, 255, 255), pos, config.SIGNAL_SIZE, 3)
-            
-            # Draw side label
-            label = self.font_small.render(side, True, config.COLOR_TEXT)
-            label_pos = (pos[0] - label.get_width()//2, pos[1] - 65)
-            self.screen.blit(label, label_pos)
+            # Signal box, light and side label (pre-rendered per state)
+            sprite, (offset_x, offset_y) = self._get_signal_sprite(side, state)
+            self._blit(sprite, (pos[0] - offset_x, pos[1] - offset_y))
             
             # Draw countdown timer
             remaining_time = signal_controller.get_remaining_time()
             if signal_controller.current_side == side and remaining_time > 0:
                 timer_text = f"{int(remaining_time)}s"
-                timer = self.font_small.render(timer_text, True, config.COLOR_TEXT)
+                timer = self._text(self.font_small, timer_text, config.COLOR_TEXT)
                 timer_pos = (pos[0] - timer.get_width()//2, pos[1] + 50)
-                self.screen.blit(timer, timer_pos)
+                self._blit(timer, timer_pos)
+    
+    def _get_signal_sprite(self, side, state):
+        """
+        Signal drawn once per side and state
+        
+        Args:
+            side (str): Side name (used for the label)
+            state (SignalState): Signal state
+            
+        Returns:
+            tuple: (sprite, position of the light center inside the sprite)
+        """
+        key = (side, state)
+        if key in self.signal_sprites:
+            return self.signal_sprites[key]
+        
+        # Choose color based on state
+        if state == SignalState.RED:
+            color = config.COLOR_SIGNAL_RED
+        elif state == SignalState.YELLOW:
+            color = config.COLOR_SIGNAL_YELLOW
+        else:  # GREEN
+            color = config.COLOR_SIGNAL_GREEN
+        
+        label = self._text(self.font_small, side, config.COLOR_TEXT)
+        
+        # Light center inside the sprite; room for the label above the box
+        half_width = max(25, config.SIGNAL_SIZE, label.get_width() // 2) + 1
+        center = (half_width, 65)
+        sprite = pygame.Surface((2 * half_width, 65 + 41), pygame.SRCALPHA)
+        
+        # Draw signal background (black box)
+        signal_rect = pygame.Rect(center[0] - 25, center[1] - 40, 50, 80)
+        pygame.draw.rect(sprite, (0, 0, 0), signal_rect, border_radius=10)
+        
+        # Draw signal light
+        pygame.draw.circle(sprite, color, center, config.SIGNAL_SIZE)
+        pygame.draw.circle(sprite, (255, 255, 255), center, config.SIGNAL_SIZE, 3)
+        
+        # Draw side label
+        sprite.blit(label, (center[0] - label.get_width()//2, 0))
+        
+        self.signal_sprites[key] = (self._convert(sprite), center)
+        return self.signal_sprites[key]
     
     def _draw_vehicles(self, vehicles):
         """Draw all vehicles with realistic appearance and license plates"""
+        # Bodies and plates in one blits() call, in the same order as drawing
+        # vehicle by vehicle (so overlapping vehicles layer the same way)
+        blit_list = []
         for vehicle in vehicles:
-            self._draw_single_vehicle(vehicle)
+            blit_list.extend(self._vehicle_blits(vehicle))
+        if self.renderer is None:
+            self.dirty_rects.extend(self.screen.blits(blit_list))
+        else:
+            for surface, pos in blit_list:
+                self._blit(surface, pos)
     
-    def _draw_single_vehicle(self, vehicle):
-        """Draw a single vehicle with realistic details"""
+    def _vehicle_blits(self, vehicle):
+        """
+        Sprites and positions for one vehicle
+        
+        Args:
+            vehicle (Vehicle): Vehicle to draw
+            
+        Returns:
+            list: (surface, position) pairs - body, then license plate
+        """
         # Determine orientation
         is_vertical = vehicle.side in ["NORTH", "SOUTH"]
         
@@ -232,26 +460,62 @@ class TrafficDisplay:
             x = vehicle.x - w//2
             y = vehicle.y - h//2
         
-        # Draw based on vehicle type
-        if vehicle.vehicle_type == "CAR":
-            self._draw_car(x, y, w, h, vehicle.color, is_vertical)
-        elif vehicle.vehicle_type == "TRUCK":
-            self._draw_truck(x, y, w, h, vehicle.color, is_vertical)
-        elif vehicle.vehicle_type == "BUS":
-            self._draw_bus(x, y, w, h, vehicle.color, is_vertical)
+        blits = []
+        
+        # Body based on vehicle type (pre-rendered sprite)
+        sprite = self._get_sprite(vehicle.vehicle_type, vehicle.color, w, h, is_vertical)
+        if sprite is not None:
+            blits.append((sprite, (x, y)))
+        
+        # License plate
+        blits.append(self._license_plate_blit(vehicle, x, y, w, h, is_vertical))
+        return blits
+    
+    def _get_sprite(self, vehicle_type, color, w, h, is_vertical):
+        """
+        Vehicle body drawn once per type/color/size/orientation
+        
+        Args:
+            vehicle_type (str): CAR, TRUCK or BUS
+            color (tuple): Body color
+            w, h (int): Size on screen
+            is_vertical (bool): Moving along the vertical road
+            
+        Returns:
+            pygame.Surface: Colorkeyed sprite, or None for unknown types
+        """
+        key = (vehicle_type, color, w, h, is_vertical)
+        if key in self.sprite_cache:
+            return self.sprite_cache[key]
+        
+        draw_functions = {
+            "CAR": self._draw_car,
+            "TRUCK": self._draw_truck,
+            "BUS": self._draw_bus
+        }
         
-        # Draw license plate
-        self._draw_license_plate(vehicle, x, y, w, h, is_vertical)
+        sprite = None
+        if vehicle_type in draw_functions:
+            # Opaque surface + colorkey for the rounded corners: blits much
+            # faster than per-pixel alpha, and the shapes have no soft edges
+            sprite = pygame.Surface((w, h))
+            sprite.fill(SPRITE_COLORKEY)
+            draw_functions[vehicle_type](sprite, 0, 0, w, h, color, is_vertical)
+            sprite.set_colorkey(SPRITE_COLORKEY, pygame.RLEACCEL)
+            sprite = self._convert(sprite, alpha=False)
+        
+        self.sprite_cache[key] = sprite
+        return sprite
     
-    def _draw_car(self, x, y, w, h, color, is_vertical):
+    def _draw_car(self, surface, x, y, w, h, color, is_vertical):
         """Draw a car with realistic details"""
         # Main body
         body_rect = pygame.Rect(x, y, w, h)
-        pygame.draw.rect(self.screen, color, body_rect, border_radius=4)
-        pygame.draw.rect(self.screen, (0, 0, 0), body_rect, 2, border_radius=4)
+        pygame.draw.rect(surface, color, body_rect, border_radius=4)
+        pygame.draw.rect(surface, (0, 0, 0), body_rect, 2, border_radius=4)
         
         # Windows (darker shade)
-        window_color = tuple(max(0, c - 80) for c in color)
+        window_color = _darken(color, 80)
         if is_vertical:
             # Front and rear windows
             front_window = pygame.Rect(x + 3, y + 3, w - 6, h//3 - 3)
@@ -261,8 +525,8 @@ class TrafficDisplay:
             front_window = pygame.Rect(x + 3, y + 3, w//3 - 3, h - 6)
             rear_window = pygame.Rect(x + 2*w//3, y + 3, w//3 - 3, h - 6)
         
-        pygame.draw.rect(self.screen, window_color, front_window, border_radius=2)
-        pygame.draw.rect(self.screen, window_color, rear_window, border_radius=2)
+        pygame.draw.rect(surface, window_color, front_window, border_radius=2)
+        pygame.draw.rect(surface, window_color, rear_window, border_radius=2)
         
         # Wheels (small black circles)
         wheel_radius = 3
@@ -278,12 +542,12 @@ class TrafficDisplay:
             wheel4 = (x + w - 5, y + 3*h//4)
         
         for wheel_pos in [wheel1, wheel2, wheel3, wheel4]:
-            pygame.draw.circle(self.screen, (30, 30, 30), wheel_pos, wheel_radius)
+            pygame.draw.circle(surface, (30, 30, 30), wheel_pos, wheel_radius)
     
-    def _draw_truck(self, x, y, w, h, color, is_vertical):
+    def _draw_truck(self, surface, x, y, w, h, color, is_vertical):
         """Draw a truck with cargo area"""
         # Cargo area (rear)
-        cargo_color = tuple(max(0, c - 40) for c in color)
+        cargo_color = _darken(color, 40)
         if is_vertical:
             cargo_rect = pygame.Rect(x, y + h//2, w, h//2)
             cab_rect = pygame.Rect(x, y, w, h//2)
@@ -291,20 +555,20 @@ class TrafficDisplay:
             cargo_rect = pygame.Rect(x + w//2, y, w//2, h)
             cab_rect = pygame.Rect(x, y, w//2, h)
         
-        pygame.draw.rect(self.screen, cargo_color, cargo_rect, border_radius=3)
-        pygame.draw.rect(self.screen, (0, 0, 0), cargo_rect, 2, border_radius=3)
+        pygame.draw.rect(surface, cargo_color, cargo_rect, border_radius=3)
+        pygame.draw.rect(surface, (0, 0, 0), cargo_rect, 2, border_radius=3)
         
         # Cab (front)
-        pygame.draw.rect(self.screen, color, cab_rect, border_radius=3)
-        pygame.draw.rect(self.screen, (0, 0, 0), cab_rect, 2, border_radius=3)
+        pygame.draw.rect(surface, color, cab_rect, border_radius=3)
+        pygame.draw.rect(surface, (0, 0, 0), cab_rect, 2, border_radius=3)
         
         # Windows
-        window_color = tuple(max(0, c - 80) for c in color)
+        window_color = _darken(color, 80)
         if is_vertical:
             window = pygame.Rect(x + 4, y + 4, w - 8, h//4)
         else:
             window = pygame.Rect(x + 4, y + 4, w//4, h - 8)
-        pygame.draw.rect(self.screen, window_color, window, border_radius=2)
+        pygame.draw.rect(surface, window_color, window, border_radius=2)
         
         # Larger wheels
         wheel_radius = 4
@@ -316,29 +580,29 @@ class TrafficDisplay:
                      (x + w//2 + 6, y + h//4), (x + w//2 + 6, y + 3*h//4)]
         
         for wheel_pos in wheels:
-            pygame.draw.circle(self.screen, (30, 30, 30), wheel_pos, wheel_radius)
+            pygame.draw.circle(surface, (30, 30, 30), wheel_pos, wheel_radius)
     
-    def _draw_bus(self, x, y, w, h, color, is_vertical):
+    def _draw_bus(self, surface, x, y, w, h, color, is_vertical):
         """Draw a bus with multiple windows"""
         # Main body
         body_rect = pygame.Rect(x, y, w, h)
-        pygame.draw.rect(self.screen, color, body_rect, border_radius=4)
-        pygame.draw.rect(self.screen, (0, 0, 0), body_rect, 2, border_radius=4)
+        pygame.draw.rect(surface, color, body_rect, border_radius=4)
+        pygame.draw.rect(surface, (0, 0, 0), body_rect, 2, border_radius=4)
         
         # Multiple windows
-        window_color = tuple(max(0, c - 80) for c in color)
+        window_color = _darken(color, 80)
         num_windows = 4
         
         if is_vertical:
             window_h = (h - 10) // num_windows
             for i in range(num_windows):
                 window = pygame.Rect(x + 4, y + 5 + i * window_h, w - 8, window_h - 5)
-                pygame.draw.rect(self.screen, window_color, window, border_radius=1)
+                pygame.draw.rect(surface, window_color, window, border_radius=1)
         else:
             window_w = (w - 10) // num_windows
             for i in range(num_windows):
                 window = pygame.Rect(x + 5 + i * window_w, y + 4, window_w - 5, h - 8)
-                pygame.draw.rect(self.screen, window_color, window, border_radius=1)
+                pygame.draw.rect(surface, window_color, window, border_radius=1)
         
         # Wheels
         wheel_radius = 4
@@ -350,21 +614,17 @@ class TrafficDisplay:
                      (x + w - 6, y + h//4), (x + w - 6, y + 3*h//4)]
         
         for wheel_pos in wheels:
-            pygame.draw.circle(self.screen, (30, 30, 30), wheel_pos, wheel_radius)
+            pygame.draw.circle(surface, (30, 30, 30), wheel_pos, wheel_radius)
     
-    def _draw_license_plate(self, vehicle, x, y, w, h, is_vertical):
-        """Draw license plate on vehicle"""
-        plate_text = vehicle.vehicle_id
-        
-        # Create license plate surface
-        plate_font = pygame.font.Font(None, 14)
-        text_surface = plate_font.render(plate_text, True, (0, 0, 0))
+    def _license_plate_blit(self, vehicle, x, y, w, h, is_vertical):
+        """
+        License plate sprite and its position on the vehicle
         
-        # License plate background (white/yellow)
-        plate_bg_color = (255, 255, 200)
-        padding = 2
-        plate_w = text_surface.get_width() + padding * 2
-        plate_h = text_surface.get_height() + padding * 2
+        Returns:
+            tuple: (plate surface, position)
+        """
+        plate = self._get_plate(vehicle.vehicle_id)
+        plate_w, plate_h = plate.get_size()
         
         # Position license plate
         if is_vertical:
@@ -376,37 +636,71 @@ class TrafficDisplay:
             plate_x = x + w - plate_w - 2
             plate_y = y + h//2 - plate_h//2
         
-        # Draw plate background
-        plate_rect = pygame.Rect(plate_x, plate_y, plate_w, plate_h)
-        pygame.draw.rect(self.screen, plate_bg_color, plate_rect, border_radius=2)
-        pygame.draw.rect(self.screen, (0, 0, 0), plate_rect, 1, border_radius=2)
+        return plate, (plate_x, plate_y)
+    
+    def _get_plate(self, plate_text):
+        """
+        License plate (background, border and text) rendered once per plate
+        
+        Args:
+            plate_text (str): License plate number
+            
+        Returns:
+            pygame.Surface: Plate sprite
+        """
+        plate = self.plate_cache.get(plate_text)
+        if plate is not None:
+            return plate
+        
+        # Plates of vehicles that left are never shown again
+        if len(self.plate_cache) >= TEXT_CACHE_LIMIT:
+            self.plate_cache.clear()
+        
+        text_surface = self.font_plate.render(plate_text, True, (0, 0, 0))
+        
+        # License plate background (white/yellow)
+        plate_bg_color = (255, 255, 200)
+        padding = 2
+        plate_w = text_surface.get_width() + padding * 2
+        plate_h = text_surface.get_height() + padding * 2
+        
+        plate = pygame.Surface((plate_w, plate_h), pygame.SRCALPHA)
+        plate_rect = pygame.Rect(0, 0, plate_w, plate_h)
+        pygame.draw.rect(plate, plate_bg_color, plate_rect, border_radius=2)
+        pygame.draw.rect(plate, (0, 0, 0), plate_rect, 1, border_radius=2)
         
         # Draw text
-        self.screen.blit(text_surface, (plate_x + padding, plate_y + padding))
+        plate.blit(text_surface, (padding, padding))
+        
+        plate = self._convert(plate)
+        self.plate_cache[plate_text] = plate
+        return plate
+    
+    def _create_stats_panel(self):
+        """Create the dark, semi-transparent statistics panel background"""
+        panel_surface = pygame.Surface((350, 400))
+        panel_surface.set_alpha(200)
+        panel_surface.fill((20, 20, 20))
+        return panel_surface
     
     def _draw_statistics(self, intersection):
         """Draw comprehensive statistics panel"""
         panel_x = 20
         panel_y = 100
         
-        # Semi-transparent background panel
-        panel_width = 350
-        panel_height = 400
-        panel_surface = pygame.Surface((panel_width, panel_height))
-        panel_surface.set_alpha(200)
-        panel_surface.fill((20, 20, 20))
-        self.screen.blit(panel_surface, (panel_x, panel_y))
+        # Semi-transparent background panel (all text is drawn inside it)
+        self._blit(self.stats_panel, (panel_x, panel_y))
         
         y_offset = panel_y + 15
         
         # Title
-        title = self.font_medium.render("Statistics", True, config.COLOR_TEXT)
-        self.screen.blit(title, (panel_x + 15, y_offset))
+        title = self._text(self.font_medium, "Statistics", config.COLOR_TEXT)
+        self._blit(title, (panel_x + 15, y_offset))
         y_offset += 45
         
         # Current vehicles by side
-        side_title = self.font_small.render("Vehicles Waiting:", True, config.COLOR_TEXT)
-        self.screen.blit(side_title, (panel_x + 15, y_offset))
+        side_title = self._text(self.font_small, "Vehicles Waiting:", config.COLOR_TEXT)
+        self._blit(side_title, (panel_x + 15, y_offset))
         y_offset += 30
         
         for side in ["NORTH", "SOUTH", "EAST", "WEST"]:
@@ -422,47 +716,43 @@ class TrafficDisplay:
                 color = config.COLOR_SIGNAL_RED
             
             text = f"  {side}: {count}"
-            label = self.font_small.render(text, True, color)
-            self.screen.blit(label, (panel_x + 20, y_offset))
+            label = self._text(self.font_small, text, color)
+            self._blit(label, (panel_x + 20, y_offset))
             y_offset += 28
         
         y_offset += 15
         
         # Total vehicles
         total = intersection.get_total_vehicle_count()
-        total_text = self.font_small.render(f"Total Waiting: {total}", True, config.COLOR_TEXT)
-        self.screen.blit(total_text, (panel_x + 15, y_offset))
+        total_text = self._text(self.font_small, f"Total Waiting: {total}", config.COLOR_TEXT)
+        self._blit(total_text, (panel_x + 15, y_offset))
         y_offset += 35
         
         # Vehicles crossed
         crossed = intersection.total_vehicles_crossed
-        crossed_text = self.font_small.render(f"Vehicles Crossed: {crossed}", True, config.COLOR_TEXT)
-        self.screen.blit(crossed_text, (panel_x + 15, y_offset))
+        crossed_text = self._text(self.font_small, f"Vehicles Crossed: {crossed}", config.COLOR_TEXT)
+        self._blit(crossed_text, (panel_x + 15, y_offset))
         y_offset += 30
         
         # By type
-        type_title = self.font_small.render("Crossed by Type:", True, config.COLOR_TEXT)
-        self.screen.blit(type_title, (panel_x + 15, y_offset))
+        type_title = self._text(self.font_small, "Crossed by Type:", config.COLOR_TEXT)
+        self._blit(type_title, (panel_x + 15, y_offset))
         y_offset += 28
         
         for vtype, color in config.VEHICLE_COLORS.items():
             count = intersection.vehicles_crossed_by_type[vtype]
             text = f"  {vtype}: {count}"
-            label = self.font_small.render(text, True, color)
-            self.screen.blit(label, (panel_x + 20, y_offset))
+            label = self._text(self.font_small, text, color)
+            self._blit(label, (panel_x + 20, y_offset))
             y_offset += 28
     
     def _draw_controls(self):
         """Draw control instructions"""
-        controls = [
-            "Controls: ESC or Q - Exit  |  F - Toggle Fullscreen"
-        ]
-        
-        y_offset = self.height - 40
-        for control_text in controls:
-            control = self.font_small.render(control_text, True, config.COLOR_TEXT)
-            self.screen.blit(control, (self.width // 2 - control.get_width() // 2, y_offset))
-            y_offset += 30
+        # Drawn every frame, not baked into the background: vehicles on the
+        # south road pass under this line
+        control = self._text(self.font_small, "Controls: ESC or Q - Exit  |  F - Toggle Fullscreen",
+                             config.COLOR_TEXT)
+        self._blit(control, (self.cx - control.get_width() // 2, self.height - 40))
     
     def check_events(self):
         """
@@ -471,14 +761,20 @@ class TrafficDisplay:
         Returns:
             bool: True if user wants to quit
         """
-        for event in pygame.event.get():
+        # Only QUIT and key presses matter; other events (mouse motion etc.)
+        # are dropped without building Python event objects for them. The
+        # clear must not pump, or a QUIT/KEYDOWN arriving after the get
+        # would be dropped too
+        events = pygame.event.get((pygame.QUIT, pygame.KEYDOWN))
+        pygame.event.clear(pump=False)
+        
+        for event in events:
             if event.type == pygame.QUIT:
                 return True
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE or event.key == pygame.K_q:
-                    return True
-                elif event.key == pygame.K_f:
-                    self.toggle_fullscreen()
+            elif event.key == pygame.K_ESCAPE or event.key == pygame.K_q:
+                return True
+            elif event.key == pygame.K_f:
+                self.toggle_fullscreen()
         return False
     
     def cleanup(self):
@@ -6,9 +6,12 @@ Contains all timing parameters, thresholds, and paths
 import os
 
 # ==================== PROJECT PATHS ====================
-BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Resolved once; every other path is built from these two
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+BASE_DIR = os.path.dirname(APP_DIR)
 VIDEO_DIR = os.path.join(BASE_DIR, "video")
-LOGS_DIR = os.path.join(BASE_DIR, "smart_traffic_system", "logs")
+LOGS_DIR = os.path.join(APP_DIR, "logs")
+CACHE_DIR = os.path.join(APP_DIR, "cache")
 MODEL_PATH = os.path.join(BASE_DIR, "yolov8n.pt")
 
 # ==================== VIDEO SOURCES ====================
@@ -50,6 +53,37 @@ EMERGENCY_CLASSES = {
     "fire_truck": 6
 }
 
+# ==================== MODEL ACCELERATION ====================
+# Export the YOLO weights once and run the optimized model instead of .pt
+# (TensorRT engine on NVIDIA GPUs, OpenVINO on CPU-only machines)
+USE_OPTIMIZED_MODEL = True
+
+# Inference image size (an exported engine is fixed to this size)
+MODEL_IMGSZ = 640
+
+# Frames per YOLO forward pass (one frame from each side)
+DETECTION_BATCH_SIZE = 4
+
+# TensorRT precision - FP16 by default, INT8 needs a calibration dataset
+# (FP16 also applies to PyTorch weights run on CUDA, e.g. GPUs without INT8)
+TENSORRT_HALF = True
+TENSORRT_INT8 = False
+
+# GPU memory (GB) TensorRT may use for tactics while building the engine
+TENSORRT_WORKSPACE = 4
+
+# OpenVINO (CPU) precision - INT8 roughly doubles throughput on CPUs with
+# VNNI/AMX. Applied only when nncf is installed (FP32 otherwise); the
+# calibration dataset is then sampled from VIDEO_SOURCES if missing
+OPENVINO_INT8 = True
+
+# Dataset YAML with representative traffic frames for INT8 calibration
+# (sampled frames go to calib_images/ next to it)
+INT8_CALIBRATION_DATA = os.path.join(CACHE_DIR, "int8_calibration", "calib.yaml")
+
+# Frames sampled (spread over all VIDEO_SOURCES) when building that dataset
+INT8_CALIBRATION_FRAMES = 200
+
 # ==================== TRAFFIC CLEARANCE ====================
 # Vehicle count threshold for considering a lane "clear"
 CLEARANCE_THRESHOLD = 3
@@ -88,6 +122,11 @@ LOG_FILE = os.path.join(LOGS_DIR, "traffic_system.log")
 # CSV log file for data analysis
 CSV_LOG_FILE = os.path.join(LOGS_DIR, "traffic_data.csv")
 
+# Log lines/rows are written by a background thread in batches: when this
+# many are pending, or after LOG_FLUSH_INTERVAL seconds
+LOG_FLUSH_ROWS = 100
+LOG_FLUSH_INTERVAL = 1.0
+
 # ==================== SYSTEM MODES ====================
 # Automatic mode: System controls signals based on traffic
 AUTO_MODE = True
@@ -103,9 +142,48 @@ FAILSAFE_TIMER = 30  # Fixed green time in fail-safe mode
 # Frame processing rate (process every Nth frame)
 FRAME_SKIP = 2  # Process every 2nd frame for better performance
 
+# Run YOLO on every Nth processing cycle and reuse the last counts/boxes in
+# between (traffic density changes much slower than MIN_GREEN_TIME)
+DETECTION_STRIDE = 5
+
+# Reuse a side's last detection while its view is static: a frame is static
+# when its mean absolute gray-level change (0-255) from the last detected
+# frame, compared as MOTION_SIZE thumbnails, is below MOTION_THRESHOLD
+# (0 disables). At most MAX_STATIC_SKIPS detections are skipped in a row.
+MOTION_THRESHOLD = 2.0
+MOTION_SIZE = (160, 90)
+MAX_STATIC_SKIPS = 10
+
+# Keep a side's preview when a new frame's mean absolute change (0-255) from
+# the shown one, sampled every 8th pixel, is below this (0 disables); frames
+# with new detections or counts are always shown
+PREVIEW_SKIP_THRESHOLD = 1.0
+
 # Video FPS (for timing calculations)
 VIDEO_FPS = 30
 
+# Decode video with FFMPEG hardware acceleration (NVDEC/VAAPI/D3D11) when available
+HW_VIDEO_DECODE = True
+
+# CPU cores to pin the processing (detection/control) thread to, e.g. (1, 2)
+# to keep core 0 for the GUI. Opt-in (None = no pinning): threads the model
+# creates later inherit the set, so pinning can throttle CPU inference.
+# Ignored where the OS has no affinity API or the cores don't exist
+PROCESSING_THREAD_CPUS = None
+
+# Niceness change for the processing thread (negative = higher priority;
+# needs privileges, skipped otherwise)
+PROCESSING_THREAD_NICE = -5
+
+# ==================== HEADLESS MODE ====================
+# Used with `python main.py --headless` (no GUI window, e.g. on a server)
+# Interval (seconds) between annotated JPEG snapshots of each feed
+SNAPSHOT_INTERVAL = 10
+
+# Snapshot output folder and JPEG quality
+SNAPSHOT_DIR = os.path.join(LOGS_DIR, "snapshots")
+SNAPSHOT_JPEG_QUALITY = 75
+
 # ==================== EMERGENCY VEHICLE PRIORITY ====================
 # Enable emergency vehicle detection
 ENABLE_EMERGENCY_DETECTION = True
@@ -4,10 +4,13 @@ Manages sequential traffic signal logic with adaptive timing
 """
 
 import time
-from enum import Enum
-from typing import Dict, Optional
+import itertools
+from collections import deque
+from enum import IntEnum
+from typing import Dict, Optional, Sequence, Tuple
 import sys
 import os
+import numpy as np
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from config import (
@@ -15,14 +18,29 @@ from config import (
     ALL_RED_TIME, CLEARANCE_THRESHOLD, CLEARANCE_WAIT_TIME,
     SIGNAL_SEQUENCE, EMERGENCY_GREEN_TIME, ENABLE_EMERGENCY_DETECTION
 )
+from utils.logger import console
 
+# Nanoseconds per second (timers use integer time.monotonic_ns() values)
+NS = 1_000_000_000
 
-class SignalState(Enum):
-    """Traffic signal states"""
-    RED = "RED"
-    YELLOW = "YELLOW"
-    GREEN = "GREEN"
-    ALL_RED = "ALL_RED"
+# Number of recent signal changes kept in memory (the log file has them all)
+SIGNAL_HISTORY_SIZE = 1024
+
+
+class SignalState(IntEnum):
+    """Traffic signal states (int values, as stored in the state array)"""
+    RED = 0
+    YELLOW = 1
+    GREEN = 2
+    ALL_RED = 3
+    
+    def __str__(self):
+        return self.name
+
+
+# Plain ints for the state array, and the SignalState for each int
+RED, YELLOW, GREEN, ALL_RED = (int(state) for state in SignalState)
+STATES = tuple(SignalState)
 
 
 class TrafficSignalController:
@@ -37,9 +55,17 @@ class TrafficSignalController:
         self.current_side_index = 0
         self.current_side = self.signal_sequence[0]
         
-        # Signal states for all sides
-        self.signal_states = {side: SignalState.RED for side in self.signal_sequence}
-        self.signal_states[self.current_side] = SignalState.GREEN
+        # Signal state of every side, indexed like signal_sequence
+        self.side_idx = {side: i for i, side in enumerate(self.signal_sequence)}
+        self.signal_states = np.full(len(self.signal_sequence), RED, dtype=np.int8)
+        self.signal_states[self.current_side_index] = GREEN
+        
+        # Read-only view handed out by get_signal_states() (no copy per call)
+        self._states_view = self.signal_states.view()
+        self._states_view.flags.writeable = False
+        
+        # Bumped whenever signal_states changes (see get_signal_states_if_changed)
+        self._state_gen = 0
         
         # Timing parameters
         self.max_green_time = MAX_GREEN_TIME
@@ -50,19 +76,27 @@ class TrafficSignalController:
         # Clearance detection
         self.clearance_threshold = CLEARANCE_THRESHOLD
         self.clearance_wait_time = CLEARANCE_WAIT_TIME
-        self.low_traffic_start_time = None
+        self._low_traffic_deadline_ns = None
         
-        # Current green light timer
-        self.green_start_time = time.time()
-        self.current_green_duration = 0
+        # Result of the last update() that changed nothing, reused while the
+        # vehicle count is unchanged and no deadline is due (see update())
+        self._last_vehicles = -1
+        self._noop_result = None
         
-        # Emergency handling
+        # Current green light timer: one clock read per update(), and the
+        # deadlines are fixed when the green starts
+        self._now_ns = time.monotonic_ns()
+        self._start_green()
+        
+        # Emergency handling (flags written by set_emergency, one per side)
         self.emergency_mode = False
         self.emergency_side = None
+        self.emergency_flags = np.zeros(len(self.signal_sequence), dtype=np.bool_)
         
         # Statistics
         self.total_cycles = 0
-        self.signal_change_history = []
+        self.signal_changes = 0
+        self.signal_change_history = deque(maxlen=SIGNAL_HISTORY_SIZE)
         
         print("="*60)
         print("TRAFFIC SIGNAL CONTROLLER INITIALIZED")
@@ -74,31 +108,43 @@ class TrafficSignalController:
         print(f"Clearance Threshold: {self.clearance_threshold} vehicles")
         print("="*60 + "\n")
     
-    def update(self, vehicle_counts: Dict[str, int]) -> Dict[str, any]:
+    def _start_green(self):
+        """Start the green timer of the current side at the last clock read"""
+        self._green_start_ns = self._now_ns
+        self._min_green_deadline_ns = self._now_ns + self.min_green_time * NS
+        self._green_deadline_ns = self._now_ns + self.max_green_time * NS
+        self._noop_until_ns = 0
+    
+    @property
+    def current_green_duration(self) -> float:
+        """Seconds the current side has been green (as of the last update)"""
+        return (self._now_ns - self._green_start_ns) / NS
+    
+    def update(self, vehicle_totals: Sequence[int]) -> Dict[str, any]:
         """
         Update traffic signal based on current vehicle counts
         
         Args:
-            vehicle_counts: Dictionary mapping side names to vehicle data (dict or int)
+            vehicle_totals: Vehicle count per side, indexed like signal_sequence;
+                emergency vehicles are reported separately via set_emergency()
             
         Returns:
             Dictionary with signal update information
         """
-        current_time = time.time()
-        self.current_green_duration = current_time - self.green_start_time
+        self._now_ns = time.monotonic_ns()
         
         # Get vehicle count for current active side
-        current_data = vehicle_counts.get(self.current_side, 0)
+        current_vehicles = vehicle_totals[self.current_side_index]
         
-        # Extract vehicle count (handle both dict and int)
-        if isinstance(current_data, dict):
-            current_vehicles = current_data.get('total_vehicles', 0)
-        else:
-            current_vehicles = current_data
+        # Same count as the last no-op update and no deadline due: nothing
+        # can change, only the remaining time moves on
+        if current_vehicles == self._last_vehicles and self._now_ns < self._noop_until_ns:
+            self._noop_result["time_remaining"] = max(0, self.max_green_time - self.current_green_duration)
+            return self._noop_result
         
         # Check for emergency vehicles on any side
         if ENABLE_EMERGENCY_DETECTION:
-            emergency_detected = self._check_emergency(vehicle_counts)
+            emergency_detected = self._check_emergency()
             if emergency_detected:
                 return self._handle_emergency(emergency_detected)
         
@@ -108,14 +154,24 @@ class TrafficSignalController:
         if should_switch:
             return self._switch_to_next_signal()
         
-        # No switch needed
-        return {
+        # No switch needed - nothing changes until the next deadline (min
+        # green, early clearance or max green) or a new count/emergency
+        if self._now_ns < self._min_green_deadline_ns:
+            self._noop_until_ns = self._min_green_deadline_ns
+        elif self._low_traffic_deadline_ns is None:
+            self._noop_until_ns = self._green_deadline_ns
+        else:
+            self._noop_until_ns = min(self._green_deadline_ns, self._low_traffic_deadline_ns)
+        self._last_vehicles = current_vehicles
+        
+        self._noop_result = {
             "switched": False,
             "current_side": self.current_side,
-            "signal_states": self.get_signal_states(),
+            "signal_states": self.signal_states.copy(),
             "time_remaining": max(0, self.max_green_time - self.current_green_duration),
             "reason": "Continuing current signal"
         }
+        return self._noop_result
     
     def _should_switch_signal(self, current_vehicles: int) -> bool:
         """
@@ -128,28 +184,27 @@ class TrafficSignalController:
             True if signal should switch, False otherwise
         """
         # Must maintain minimum green time
-        if self.current_green_duration < self.min_green_time:
+        if self._now_ns < self._min_green_deadline_ns:
             return False
         
         # ALWAYS force switch at maximum green time (ensures all sides get turns)
-        if self.current_green_duration >= self.max_green_time:
-            print(f"  → Switching {self.current_side}: Max time reached ({self.max_green_time}s)")
+        if self._now_ns >= self._green_deadline_ns:
+            console.print(f"  → Switching {self.current_side}: Max time reached ({self.max_green_time}s)")
             return True
         
         # Early clearance detection (only switch early if traffic is VERY low)
         # This ensures busy sides don't monopolize the green light
         if current_vehicles <= self.clearance_threshold:
-            if self.low_traffic_start_time is None:
-                self.low_traffic_start_time = time.time()
+            if self._low_traffic_deadline_ns is None:
+                self._low_traffic_deadline_ns = self._now_ns + self.clearance_wait_time * NS
             
             # Check if low traffic persisted long enough
-            low_traffic_duration = time.time() - self.low_traffic_start_time
-            if low_traffic_duration >= self.clearance_wait_time:
-                print(f"  → Switching {self.current_side}: Early clearance (only {current_vehicles} vehicles)")
+            if self._now_ns >= self._low_traffic_deadline_ns:
+                console.print(f"  → Switching {self.current_side}: Early clearance (only {current_vehicles} vehicles)")
                 return True
         else:
             # Reset low traffic timer if vehicles increase
-            self.low_traffic_start_time = None
+            self._low_traffic_deadline_ns = None
         
         return False
     
@@ -161,40 +216,36 @@ class TrafficSignalController:
             Dictionary with switch information
         """
         previous_side = self.current_side
+        previous_index = self.current_side_index
         previous_duration = self.current_green_duration
-        
-        # Set current side to yellow
-        self.signal_states[self.current_side] = SignalState.YELLOW
         reason = self._get_switch_reason(previous_duration)
         
         # Move to next side in sequence
         self.current_side_index = (self.current_side_index + 1) % len(self.signal_sequence)
         self.current_side = self.signal_sequence[self.current_side_index]
         
-        # Update all signal states
-        for side in self.signal_sequence:
-            if side == self.current_side:
-                self.signal_states[side] = SignalState.GREEN
-            elif side == previous_side:
-                self.signal_states[side] = SignalState.YELLOW
-            else:
-                self.signal_states[side] = SignalState.RED
+        # Update all signal states (previous side turns yellow)
+        self.signal_states[:] = RED
+        self.signal_states[self.current_side_index] = GREEN
+        self.signal_states[previous_index] = YELLOW
+        self._state_gen += 1
         
         # Reset timers
-        self.green_start_time = time.time()
-        self.low_traffic_start_time = None
+        self._start_green()
+        self._low_traffic_deadline_ns = None
         
         # Update statistics
         if self.current_side == self.signal_sequence[0]:
             self.total_cycles += 1
         
-        # Print signal change for visibility
-        print(f"\n{'='*60}")
-        print(f"SIGNAL CHANGE: {previous_side} \u2192 {self.current_side}")
-        print(f"Duration: {previous_duration:.1f}s | Reason: {reason}")
-        print(f"{'='*60}\n")
+        # Print signal change for visibility (off the control thread)
+        console.print(f"\n{'='*60}\n"
+                      f"SIGNAL CHANGE: {previous_side} \u2192 {self.current_side}\n"
+                      f"Duration: {previous_duration:.1f}s | Reason: {reason}\n"
+                      f"{'='*60}\n")
         
         # Record change
+        self.signal_changes += 1
         self.signal_change_history.append({
             "time": time.time(),
             "from_side": previous_side,
@@ -208,7 +259,7 @@ class TrafficSignalController:
             "from_side": previous_side,
             "to_side": self.current_side,
             "duration": previous_duration,
-            "signal_states": self.get_signal_states(),
+            "signal_states": self.signal_states.copy(),
             "reason": reason,
             "total_cycles": self.total_cycles
         }
@@ -217,25 +268,34 @@ class TrafficSignalController:
         """Get reason for signal switch"""
         if duration >= self.max_green_time:
             return "Maximum time reached"
-        elif self.low_traffic_start_time is not None:
+        elif self._low_traffic_deadline_ns is not None:
             return "Early clearance - low traffic"
         else:
             return "Standard switch"
     
-    def _check_emergency(self, vehicle_counts: Dict[str, any]) -> Optional[str]:
+    def set_emergency(self, side: str, detected: bool):
         """
-        Check if emergency vehicle detected on any side
+        Record whether the latest detection on a side saw an emergency vehicle
         
         Args:
-            vehicle_counts: Dictionary with vehicle information
-            
+            side: Side name
+            detected: Emergency vehicle present
+        """
+        index = self.side_idx[side]
+        if self.emergency_flags[index] != detected:
+            self.emergency_flags[index] = detected
+            self._noop_until_ns = 0
+    
+    def _check_emergency(self) -> Optional[str]:
+        """
+        Check if emergency vehicle detected on any side
+        
         Returns:
-            Side name with emergency vehicle, or None
+            First side (in signal sequence order) with an emergency vehicle, or None
         """
-        for side, data in vehicle_counts.items():
-            if isinstance(data, dict) and data.get('emergency', False):
-                return side
-        return None
+        if not self.emergency_flags.any():
+            return None
+        return self.signal_sequence[int(np.argmax(self.emergency_flags))]
     
     def _handle_emergency(self, emergency_side: str) -> Dict[str, any]:
         """
@@ -259,16 +319,14 @@ class TrafficSignalController:
         # Switch to emergency side immediately
         previous_side = self.current_side
         self.current_side = emergency_side
-        self.current_side_index = self.signal_sequence.index(emergency_side)
+        self.current_side_index = self.side_idx[emergency_side]
         
         # Update signals
-        for side in self.signal_sequence:
-            if side == emergency_side:
-                self.signal_states[side] = SignalState.GREEN
-            else:
-                self.signal_states[side] = SignalState.RED
+        self.signal_states[:] = RED
+        self.signal_states[self.current_side_index] = GREEN
+        self._state_gen += 1
         
-        self.green_start_time = time.time()
+        self._start_green()
         self.emergency_mode = True
         
         return {
@@ -276,13 +334,37 @@ class TrafficSignalController:
             "from_side": previous_side,
             "to_side": emergency_side,
             "emergency": True,
-            "signal_states": self.get_signal_states(),
+            "signal_states": self.signal_states.copy(),
             "reason": "EMERGENCY VEHICLE DETECTED - Immediate switch"
         }
     
-    def get_signal_states(self) -> Dict[str, SignalState]:
-        """Get current signal states for all sides"""
-        return self.signal_states.copy()
+    def get_signal_states(self) -> np.ndarray:
+        """
+        Get current signal states for all sides
+        
+        Returns:
+            Read-only int8 array indexed like signal_sequence (see STATES);
+            it follows later updates, copy it to keep a snapshot
+        """
+        return self._states_view
+    
+    def get_signal_states_if_changed(self, last_gen: int) -> Optional[Tuple[int, np.ndarray]]:
+        """
+        Get signal states only if they changed since a given generation
+        
+        Args:
+            last_gen: Generation returned by the previous call (-1 initially)
+            
+        Returns:
+            (generation, read-only states view) or None if unchanged
+        """
+        if last_gen == self._state_gen:
+            return None
+        return self._state_gen, self._states_view
+    
+    def get_signal_state(self, side: str) -> SignalState:
+        """Get the current signal state of one side"""
+        return STATES[self.signal_states[self.side_idx[side]]]
     
     def get_current_side(self) -> str:
         """Get current active side"""
@@ -298,8 +380,8 @@ class TrafficSignalController:
             "total_cycles": self.total_cycles,
             "current_side": self.current_side,
             "current_duration": self.current_green_duration,
-            "signal_changes": len(self.signal_change_history),
-            "recent_changes": self.signal_change_history[-10:]
+            "signal_changes": self.signal_changes,
+            "recent_changes": list(itertools.islice(reversed(self.signal_change_history), 10))[::-1]
         }
     
     def manual_override(self, target_side: str) -> bool:
@@ -312,7 +394,8 @@ class TrafficSignalController:
         Returns:
             True if successful
         """
-        if target_side not in self.signal_sequence:
+        target_index = self.side_idx.get(target_side)
+        if target_index is None:
             return False
         
         if target_side == self.current_side:
@@ -320,15 +403,15 @@ class TrafficSignalController:
         
         # Force switch to target side
         self.current_side = target_side
-        self.current_side_index = self.signal_sequence.index(target_side)
+        self.current_side_index = target_index
         
-        for side in self.signal_sequence:
-            if side == target_side:
-                self.signal_states[side] = SignalState.GREEN
-            else:
-                self.signal_states[side] = SignalState.RED
+        self.signal_states[:] = RED
+        self.signal_states[self.current_side_index] = GREEN
+        self._state_gen += 1
         
-        self.green_start_time = time.time()
+        # Called outside update(), so read the clock here
+        self._now_ns = time.monotonic_ns()
+        self._start_green()
         
         return True
 
@@ -355,7 +438,7 @@ if __name__ == "__main__":
         print(f"Current side: {controller.get_current_side()}")
         print(f"Vehicles: {vehicle_counts}")
         
-        result = controller.update(vehicle_counts)
+        result = controller.update([vehicle_counts[side] for side in controller.signal_sequence])
         
         if result["switched"]:
             print(f"→ SWITCHED from {result['from_side']} to {result['to_side']}")
@@ -12,8 +12,9 @@ This is the main entry point that integrates all system components:
 Author: CS331 Project Team
 """
 
-import tkinter as tk
+import argparse
 import threading
+import queue
 import time
 import sys
 import os
@@ -21,12 +22,19 @@ import os
 # Add current directory to path for imports
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from models.video_manager import VideoManager
-from models.vehicle_detector import VehicleDetector
-from controllers.traffic_controller import TrafficSignalController
-from views.traffic_gui import TrafficGUI
-from utils.logger import TrafficLogger
-from config import SIGNAL_SEQUENCE
+# Video, detection (torch/ultralytics) and GUI modules are imported when
+# their component is created, so `main.py --help` starts instantly
+from controllers.traffic_controller import TrafficSignalController, STATES
+from utils.logger import TrafficLogger, console
+from config import (
+    SIGNAL_SEQUENCE, DETECTION_STRIDE, VIDEO_FPS,
+    PROCESSING_THREAD_CPUS, PROCESSING_THREAD_NICE,
+    SNAPSHOT_INTERVAL, SNAPSHOT_DIR, SNAPSHOT_JPEG_QUALITY
+)
+
+# GUI redraw bits, one per side (new detections)
+SIDE_BITS = {side: 1 << i for i, side in enumerate(SIGNAL_SEQUENCE)}
+ALL_DIRTY = (1 << len(SIGNAL_SEQUENCE)) - 1
 
 
 class SmartTrafficSystem:
@@ -34,8 +42,15 @@ class SmartTrafficSystem:
     Main application class that coordinates all system components
     """
     
-    def __init__(self):
-        """Initialize the traffic signal system"""
+    def __init__(self, headless: bool = False):
+        """
+        Initialize the traffic signal system
+        
+        Args:
+            headless: Run without the GUI window, saving periodic snapshots instead
+        """
+        self.headless = headless
+        
         print("\n" + "="*70)
         print("  SMART TRAFFIC SIGNAL AUTOMATION SYSTEM")
         print("  CS331 - Software Engineering Lab Project")
@@ -47,10 +62,12 @@ class SmartTrafficSystem:
         try:
             # 1. Video Manager
             print("[1/5] Initializing Video Manager...")
+            from models.video_manager import VideoManager
             self.video_manager = VideoManager()
             
             # 2. Vehicle Detector
             print("\n[2/5] Loading Vehicle Detection Model...")
+            from models.vehicle_detector import VehicleDetector
             self.vehicle_detector = VehicleDetector()
             
             # 3. Traffic Controller
@@ -62,9 +79,16 @@ class SmartTrafficSystem:
             self.logger = TrafficLogger()
             
             # 5. GUI
-            print("\n[5/5] Creating GUI Interface...")
-            self.root = tk.Tk()
-            self.gui = TrafficGUI(self.root)
+            if headless:
+                print("\n[5/5] Headless mode - GUI disabled")
+                self.root = None
+                self.gui = None
+            else:
+                print("\n[5/5] Creating GUI Interface...")
+                import tkinter as tk
+                from views.traffic_gui import TrafficGUI
+                self.root = tk.Tk()
+                self.gui = TrafficGUI(self.root)
             
             print("\n" + "="*70)
             print("✓ ALL COMPONENTS INITIALIZED SUCCESSFULLY")
@@ -78,8 +102,26 @@ class SmartTrafficSystem:
         self.running = False
         self.processing_thread = None
         
-        # Vehicle count cache
+        # Vehicle count cache, and the totals the controller reads (indexed
+        # like SIGNAL_SEQUENCE)
         self.vehicle_counts = {side: {} for side in SIGNAL_SEQUENCE}
+        self.vehicle_totals = [0] * len(SIGNAL_SEQUENCE)
+        
+        # Id of the last frame run through detection, per side
+        self.last_frame_ids = {side: -1 for side in SIGNAL_SEQUENCE}
+        
+        # Processing thread -> GUI handoff (latest result only)
+        self.results_queue = queue.Queue(maxsize=1)
+        self.status_queue = queue.Queue()
+        self.display_counts = {side: {} for side in SIGNAL_SEQUENCE}
+        
+        # Parts of the GUI to redraw (bits set by the processing thread and
+        # cleared by the GUI loop), the last frame id shown per side and the
+        # controller's signal state generation last drawn
+        self.gui_dirty = ALL_DIRTY
+        self.gui_dirty_lock = threading.Lock()
+        self.gui_frame_ids = {side: -1 for side in SIGNAL_SEQUENCE}
+        self.gui_signal_gen = -1
         
         # Performance tracking
         self.frame_count = 0
@@ -105,6 +147,12 @@ class SmartTrafficSystem:
         )
         self.processing_thread.start()
         
+        if self.headless:
+            print("✓ System started successfully (headless)")
+            print(f"\nMonitoring traffic... snapshots every {SNAPSHOT_INTERVAL}s "
+                  f"in {SNAPSHOT_DIR} (Ctrl+C to stop)\n")
+            return
+        
         # Start GUI update loop
         self._gui_update_loop()
         
@@ -119,26 +167,52 @@ class SmartTrafficSystem:
         Main processing loop - runs in separate thread
         Handles vehicle detection and traffic control logic
         """
+        self._tune_processing_thread()
+        
         last_log_time = time.time()
         log_interval = 5  # Log every 5 seconds
+        cycle = 0
+        
+        # Cycles are paced against absolute deadlines, so the time spent
+        # processing does not add to the period
+        frame_interval = 1.0 / VIDEO_FPS
+        next_deadline = time.monotonic()
         
         while self.running:
             try:
                 # Get frames from all sides
-                frames = self.video_manager.get_all_frames()
+                frames = self.video_manager.get_all_frames_with_ids()
                 
                 if not frames:
                     time.sleep(0.1)
                     continue
                 
-                # Detect vehicles on all sides
-                for side, frame in frames.items():
-                    if frame is not None:
-                        # Run vehicle detection
-                        detection_results = self.vehicle_detector.detect_vehicles(frame)
+                # Sides whose camera delivered a frame not yet detected on
+                new_frames = {
+                    side: (frame, frame_id) for side, (frame, frame_id) in frames.items()
+                    if frame is not None and frame_id > self.last_frame_ids[side]
+                }
+                
+                # Only run YOLO every DETECTION_STRIDE cycles with new frames;
+                # in between the last counts and boxes are reused
+                detect_now = bool(new_frames) and cycle % DETECTION_STRIDE == 0
+                if new_frames:
+                    cycle += 1
+                
+                if detect_now:
+                    # Detect vehicles on the updated sides in one batched call
+                    batch_results = self.vehicle_detector.detect_vehicles_batch(
+                        {side: frame for side, (frame, _) in new_frames.items()}
+                    )
+                    
+                    for side, (frame, frame_id) in new_frames.items():
+                        self.last_frame_ids[side] = frame_id
+                        detection_results = batch_results[side]
                         
                         # Store results
                         self.vehicle_counts[side] = detection_results
+                        self.vehicle_totals[self.traffic_controller.side_idx[side]] = \
+                            detection_results.get('total_vehicles', 0)
                         
                         # Log vehicle counts periodically
                         current_time = time.time()
@@ -146,19 +220,17 @@ class SmartTrafficSystem:
                             self.logger.log_vehicle_count(side, detection_results)
                         
                         # Check for emergency vehicles
-                        if detection_results.get('emergency', False):
+                        emergency = detection_results.get('emergency', False)
+                        self.traffic_controller.set_emergency(side, emergency)
+                        if emergency:
                             self.logger.log_emergency(side)
+                    
+                    # Update log timer
+                    if time.time() - last_log_time >= log_interval:
+                        last_log_time = time.time()
                 
-                # Update log timer
-                if time.time() - last_log_time >= log_interval:
-                    last_log_time = time.time()
-                
-                # Update traffic controller
-                vehicle_count_dict = {
-                    side: data for side, data in self.vehicle_counts.items()
-                }
-                
-                control_result = self.traffic_controller.update(vehicle_count_dict)
+                # Update traffic controller (it only reads the counts)
+                control_result = self.traffic_controller.update(self.vehicle_totals)
                 
                 # Log signal changes
                 if control_result.get('switched', False):
@@ -172,15 +244,80 @@ class SmartTrafficSystem:
                     status_msg = f"Signal: {from_side} → {to_side} | {reason}"
                     is_emergency = control_result.get('emergency', False)
                     
-                    self.gui.update_status(status_msg, is_emergency)
+                    # Tkinter is not thread-safe; the GUI loop applies it
+                    self.status_queue.put((status_msg, is_emergency))
                 
-                # Small delay to prevent CPU overload
-                time.sleep(0.033)  # ~30 FPS
+                # Hand new counts to the GUI, dropping any unread ones. Result
+                # dicts are replaced, never modified, so a shallow copy is a
+                # stable snapshot; between detections the GUI keeps its copy
+                if detect_now:
+                    self._put_latest(self.results_queue, dict(self.vehicle_counts))
+                    self._mark_gui_dirty(sum(SIDE_BITS[side] for side in new_frames))
+                
+                # Run at VIDEO_FPS (restarting the cadence if we fell behind);
+                # when no camera had a new frame, sleep until one arrives instead
+                if new_frames:
+                    next_deadline += frame_interval
+                    sleep_for = next_deadline - time.monotonic()
+                    if sleep_for > 0:
+                        time.sleep(sleep_for)
+                    else:
+                        next_deadline = time.monotonic()
+                else:
+                    self.video_manager.wait_for_frames(timeout=0.1)
+                    next_deadline = time.monotonic()
                 
             except Exception as e:
-                print(f"Error in processing loop: {e}")
+                console.print(f"Error in processing loop: {e}")
                 time.sleep(0.1)
     
+    def _tune_processing_thread(self):
+        """
+        Pin the calling (processing) thread to PROCESSING_THREAD_CPUS (if
+        set) and raise its priority, so it does not compete with the GUI thread
+        
+        On Linux both calls apply to the calling thread only. Affinity is
+        skipped where unsupported (macOS, Windows); priority where not permitted.
+        """
+        if PROCESSING_THREAD_CPUS and hasattr(os, "sched_setaffinity"):
+            cpus = set(PROCESSING_THREAD_CPUS) & os.sched_getaffinity(0)
+            if cpus:
+                os.sched_setaffinity(0, cpus)
+                print(f"✓ Processing thread pinned to CPU {sorted(cpus)}")
+        
+        if PROCESSING_THREAD_NICE and hasattr(os, "nice"):
+            try:
+                os.nice(PROCESSING_THREAD_NICE)
+            except OSError:
+                pass  # Raising priority needs root/CAP_SYS_NICE
+    
+    def _put_latest(self, q: queue.Queue, item):
+        """
+        Put an item in a size-1 queue, replacing an unread older item
+        
+        Args:
+            q: Queue created with maxsize=1
+            item: Item to publish
+        """
+        try:
+            q.put_nowait(item)
+        except queue.Full:
+            try:
+                q.get_nowait()
+            except queue.Empty:
+                pass
+            q.put_nowait(item)
+    
+    def _mark_gui_dirty(self, bits: int):
+        """
+        Flag parts of the GUI for redraw on its next update
+        
+        Args:
+            bits: SIDE_BITS values or-ed together
+        """
+        with self.gui_dirty_lock:
+            self.gui_dirty |= bits
+    
     def _gui_update_loop(self):
         """
         GUI update loop - updates visual display
@@ -190,42 +327,55 @@ class SmartTrafficSystem:
             if not self.running:
                 return
             
-            # Get current signal states
-            signal_states = self.traffic_controller.get_signal_states()
+            # Take the redraw flags set since the last update
+            with self.gui_dirty_lock:
+                dirty, self.gui_dirty = self.gui_dirty, 0
+            
+            # Pick up the latest detection results, if any arrived
+            try:
+                self.display_counts = self.results_queue.get_nowait()
+            except queue.Empty:
+                pass
+            
+            # Apply status messages posted by the processing thread
+            while not self.status_queue.empty():
+                status_msg, is_emergency = self.status_queue.get_nowait()
+                self.gui.update_status(status_msg, is_emergency)
+            
+            # Get signal states, only if they changed since the last draw
+            changed_states = self.traffic_controller.get_signal_states_if_changed(
+                self.gui_signal_gen
+            )
+            if changed_states is not None:
+                self.gui_signal_gen, signal_states = changed_states
             current_side = self.traffic_controller.get_current_side()
             time_remaining = self.traffic_controller.get_time_remaining()
             
-            # Update each side
-            for side in SIGNAL_SEQUENCE:
-                # Get frame
-                frame = self.video_manager.get_frame(side)
+            frames = self.video_manager.get_all_frames_with_ids()
+            
+            # Update each side (signal_states is indexed like SIGNAL_SEQUENCE);
+            # video and info only when the camera or the detections changed
+            for i, side in enumerate(SIGNAL_SEQUENCE):
+                side_dirty = dirty & SIDE_BITS[side]
+                frame, frame_id = frames.get(side, (None, -1))
                 
-                if frame is not None:
-                    # Get vehicle data
-                    vehicle_data = self.vehicle_counts.get(side, {})
+                if frame is not None and (side_dirty or frame_id != self.gui_frame_ids[side]):
+                    self.gui_frame_ids[side] = frame_id
                     
-                    # Draw detections on frame
-                    if vehicle_data.get('detections'):
-                        frame = self.vehicle_detector.draw_detections(
-                            frame, vehicle_data['detections']
-                        )
+                    # Draw detections and stats overlay
+                    frame = self._annotate_frame(side, frame)
                     
-                    # Add stats overlay
-                    frame = self.vehicle_detector.add_stats_overlay(
-                        frame, vehicle_data, side
-                    )
-                    
-                    # Update GUI video
-                    self.gui.update_video(side, frame)
+                    # Update GUI video (a near-identical frame is skipped
+                    # unless detections or counts changed)
+                    self.gui.update_video(side, frame, skip_similar=not side_dirty)
                 
                 # Update signal indicator
-                signal_state = signal_states.get(side)
-                if signal_state:
-                    self.gui.update_signal_state(side, signal_state)
+                if changed_states is not None:
+                    self.gui.update_signal_state(side, STATES[signal_states[i]])
                 
                 # Update vehicle info
-                if side in self.vehicle_counts:
-                    self.gui.update_vehicle_info(side, self.vehicle_counts[side])
+                if side_dirty and side in self.display_counts:
+                    self.gui.update_vehicle_info(side, self.display_counts[side])
                 
                 # Update timer
                 is_active = (side == current_side)
@@ -239,6 +389,68 @@ class SmartTrafficSystem:
             if self.running:
                 self.root.after(100, self._gui_update_loop)
     
+    def _annotate_frame(self, side: str, frame):
+        """
+        Draw detection boxes and the stats overlay for one side
+        
+        Args:
+            side: Side name
+            frame: Latest raw frame of that side
+            
+        Returns:
+            Annotated copy of the frame (the detector's annotation buffer,
+            overwritten by the next call)
+        """
+        vehicle_data = self.display_counts.get(side, {})
+        
+        # One copy of the camera frame: the overlay is drawn onto the copy
+        # made for the boxes, if there was one
+        has_boxes = len(vehicle_data.get('boxes', ())) > 0
+        if has_boxes:
+            frame = self.vehicle_detector.draw_detections(frame, vehicle_data)
+        
+        return self.vehicle_detector.add_stats_overlay(frame, vehicle_data, side,
+                                                       in_place=has_boxes)
+    
+    def _headless_loop(self):
+        """
+        Main-thread loop used instead of the GUI in headless mode
+        Prints status messages and saves annotated JPEG snapshots
+        """
+        import cv2
+        
+        os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+        next_snapshot = time.time()
+        
+        while self.running:
+            # Pick up the latest detection results, if any arrived
+            try:
+                self.display_counts = self.results_queue.get_nowait()
+            except queue.Empty:
+                pass
+            
+            while not self.status_queue.empty():
+                status_msg, _ = self.status_queue.get_nowait()
+                print(status_msg)
+            
+            # Frames are only annotated and encoded when a snapshot is due
+            if time.time() >= next_snapshot:
+                next_snapshot = time.time() + SNAPSHOT_INTERVAL
+                
+                for side in SIGNAL_SEQUENCE:
+                    frame = self.video_manager.get_frame(side)
+                    if frame is None:
+                        continue
+                    
+                    ok, jpeg = cv2.imencode(
+                        '.jpg', self._annotate_frame(side, frame),
+                        [cv2.IMWRITE_JPEG_QUALITY, SNAPSHOT_JPEG_QUALITY]
+                    )
+                    if ok:
+                        jpeg.tofile(os.path.join(SNAPSHOT_DIR, f"{side.lower()}.jpg"))
+            
+            time.sleep(0.1)
+    
     def stop(self):
         """Stop the traffic system"""
         print("\nStopping system...")
@@ -248,8 +460,9 @@ class SmartTrafficSystem:
         # Stop video manager
         self.video_manager.stop()
         
-        # Log system stop
+        # Log system stop (writes out the buffered log rows)
         self.logger.log_system_stop()
+        console.flush()
         
         # Show statistics
         self._print_statistics()
@@ -279,6 +492,10 @@ class SmartTrafficSystem:
             # Start system
             self.start()
             
+            if self.headless:
+                self._headless_loop()
+                return
+            
             # Handle window close event
             self.root.protocol("WM_DELETE_WINDOW", self._on_closing)
             
@@ -300,9 +517,14 @@ class SmartTrafficSystem:
 
 def main():
     """Main entry point"""
+    parser = argparse.ArgumentParser(description="Smart Traffic Signal Automation System")
+    parser.add_argument("--headless", action="store_true",
+                        help="run without the GUI and save periodic JPEG snapshots")
+    args = parser.parse_args()
+    
     try:
         # Create and run the system
-        system = SmartTrafficSystem()
+        system = SmartTrafficSystem(headless=args.headless)
         system.run()
         
     except Exception as e:
@@ -4,17 +4,24 @@ Uses YOLOv8 to detect and count vehicles in video frames
 """
 
 import cv2
+import torch
+import torch.nn.functional as F
 from ultralytics import YOLO
 import numpy as np
 from typing import Dict, Tuple, List
 import sys
 import os
+import shutil
+import importlib.util
 
 # Add parent directory to path for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from config import (
-    MODEL_PATH, DETECTION_CONFIDENCE,
-    VEHICLE_CLASSES, EMERGENCY_CLASSES
+    MODEL_PATH, DETECTION_CONFIDENCE, VIDEO_SOURCES,
+    VEHICLE_CLASSES, EMERGENCY_CLASSES,
+    USE_OPTIMIZED_MODEL, MODEL_IMGSZ, TENSORRT_HALF, TENSORRT_INT8, TENSORRT_WORKSPACE,
+    OPENVINO_INT8, INT8_CALIBRATION_DATA, INT8_CALIBRATION_FRAMES,
+    DETECTION_BATCH_SIZE, MOTION_THRESHOLD, MOTION_SIZE, MAX_STATIC_SKIPS
 )
 
 
@@ -31,8 +38,7 @@ class VehicleDetector:
             model_path: Path to YOLOv8 model file
         """
         try:
-            self.model = YOLO(model_path)
-            print(f"✓ YOLOv8 model loaded from: {model_path}")
+            self.model = self._load_model(model_path)
         except Exception as e:
             print(f"✗ Error loading YOLO model: {e}")
             raise
@@ -41,6 +47,219 @@ class VehicleDetector:
         self.emergency_classes = EMERGENCY_CLASSES
         self.confidence_threshold = DETECTION_CONFIDENCE
         
+        # Only these COCO classes are decoded and passed through NMS
+        self.detect_class_ids = sorted(set(VEHICLE_CLASSES.values()) |
+                                       set(EMERGENCY_CLASSES.values()))
+        
+        # Class id -> box type (index into TYPE_LABELS), so boxes are sorted
+        # with one table lookup and counted with one bincount; vehicle
+        # classes win over an emergency class with the same id
+        self.class_types = np.full(max(self.detect_class_ids) + 1, self.TYPE_NONE, dtype=np.intp)
+        self.class_types[list(EMERGENCY_CLASSES.values())] = self.TYPE_EMERGENCY
+        self.class_types[VEHICLE_CLASSES["car"]] = self.TYPE_CAR
+        self.class_types[[VEHICLE_CLASSES["truck"], VEHICLE_CLASSES["bus"]]] = self.TYPE_TRUCK
+        self.class_types[VEHICLE_CLASSES["motorcycle"]] = self.TYPE_MOTORCYCLE
+        
+        # On CUDA, raw frames are uploaded once as uint8 and letterboxed and
+        # converted on the GPU (page-locked staging buffer per batch slot)
+        self.use_cuda = torch.cuda.is_available()
+        self.pinned_frames = []
+        
+        # Motion gate: per side, (gray thumbnail, result) of the last detected
+        # frame and how many detections were skipped since
+        self.static_refs = {}
+        self.static_skips = {}
+        
+        # FP16 inference when the PyTorch weights run on CUDA (an exported
+        # engine keeps the precision it was built with)
+        self.half = self.use_cuda and TENSORRT_HALF
+        
+        # Pre-rendered static overlay text, keyed by side name
+        self.hud_layers = {}
+        self.emergency_layer = None
+        
+        # Pre-rendered detection labels (filled box + text), keyed by
+        # (type, confidence text) - at most 101 per type
+        self.label_layers = {}
+        
+        # x where each HUD row's count starts, i.e. where one putText of
+        # label + count would continue (getTextSize adds the stroke
+        # thickness to the advance, so it is taken off again)
+        self.hud_value_x = [
+            20 + cv2.getTextSize(label, cv2.FONT_HERSHEY_SIMPLEX, scale, thickness)[0][0]
+            - thickness
+            for label, _, scale, _, thickness, _ in self.HUD_ROWS
+        ]
+        
+        # Frame the annotation methods draw on (unless in_place), reused
+        self.annotation_buffer = None
+        
+        # Warm-up is only an optimization; a failure here must not stop the
+        # detector from being built
+        try:
+            self._warm_up()
+        except Exception as e:
+            print(f"✗ Model warm-up failed ({e}), continuing without it")
+    
+    def _warm_up(self):
+        """
+        Run one blank full batch through the model
+        
+        The first call pays for CUDA context / engine setup, kernel
+        selection and the predictor build; doing it here keeps that stall
+        out of the first real detection cycle.
+        """
+        images = torch.zeros((DETECTION_BATCH_SIZE, 3, MODEL_IMGSZ, MODEL_IMGSZ),
+                             dtype=torch.float32, device="cuda" if self.use_cuda else "cpu")
+        self.model(images, verbose=False, imgsz=MODEL_IMGSZ, half=self.half,
+                   classes=self.detect_class_ids, conf=self.confidence_threshold)
+    
+    def _load_model(self, model_path: str) -> YOLO:
+        """
+        Load the fastest available model for this machine
+        
+        A .pt model is exported once to a TensorRT engine (CUDA GPU) or an
+        OpenVINO model (CPU) next to the weights; later runs reuse the export.
+        Falls back to the PyTorch weights if the export is unavailable or
+        the backend's packages (EXPORT_PACKAGES) are not installed - checked
+        up front so ultralytics does not pip-install them at runtime. Any
+        other model file (e.g. a prebuilt .engine) is loaded as given.
+        
+        Args:
+            model_path: Path to YOLOv8 model file
+            
+        Returns:
+            Loaded YOLO model
+        """
+        if not USE_OPTIMIZED_MODEL or not model_path.endswith(".pt"):
+            print(f"✓ YOLOv8 model loaded from: {model_path}")
+            return YOLO(model_path, task="detect")
+        
+        use_gpu = torch.cuda.is_available()
+        stem = os.path.splitext(model_path)[0]
+        
+        missing = self._missing_packages(self.EXPORT_PACKAGES["engine" if use_gpu else "openvino"])
+        if missing:
+            print(f"✗ Optimized model needs {', '.join(missing)} (not installed), "
+                  f"using PyTorch weights")
+            print(f"✓ YOLOv8 model loaded from: {model_path}")
+            return YOLO(model_path)
+        
+        if use_gpu:
+            # INT8 Tensor Cores need Turing (sm_75) or newer
+            int8 = TENSORRT_INT8 and torch.cuda.get_device_capability() >= (7, 5)
+        else:
+            # Quantizing the OpenVINO export needs nncf; without it stay FP32
+            int8 = OPENVINO_INT8 and not self._missing_packages(("nncf",))
+            if OPENVINO_INT8 and not int8:
+                print("✗ INT8 needs nncf (not installed), exporting OpenVINO FP32")
+        
+        # INT8 needs calibration frames; without them stay on FP16/FP32
+        built_calibration = False
+        if int8 and not os.path.exists(INT8_CALIBRATION_DATA):
+            int8 = built_calibration = self._build_calibration_data(model_path)
+        
+        if use_gpu:
+            # Named by precision, so changing TENSORRT_INT8 rebuilds the engine
+            export_path = stem + ("_int8" if int8 else "") + ".engine"
+            export_args = {"format": "engine", "half": TENSORRT_HALF and not int8,
+                           "int8": int8, "workspace": TENSORRT_WORKSPACE}
+        else:
+            export_path = stem + ("_int8" if int8 else "") + "_openvino_model"
+            export_args = {"format": "openvino", "int8": int8}
+        
+        # Dynamic batch so one call can carry every side's frame
+        export_args.update(dynamic=True, batch=DETECTION_BATCH_SIZE)
+        
+        if int8:
+            export_args["data"] = INT8_CALIBRATION_DATA
+        
+        try:
+            if not os.path.exists(export_path):
+                print(f"Exporting YOLOv8 model ({export_args['format']}, "
+                      f"{'INT8' if int8 else 'FP16' if export_args.get('half') else 'FP32'})...")
+                exported = YOLO(model_path).export(imgsz=MODEL_IMGSZ, **export_args)
+                if os.path.abspath(exported) != os.path.abspath(export_path):
+                    os.replace(exported, export_path)
+            
+            model = YOLO(export_path, task="detect")
+            print(f"✓ YOLOv8 model loaded from: {export_path}")
+            return model
+        except Exception as e:
+            print(f"✗ Optimized model unavailable ({e}), using PyTorch weights")
+            if built_calibration:
+                # Don't leave frames behind for an export that never happened
+                shutil.rmtree(os.path.dirname(INT8_CALIBRATION_DATA), ignore_errors=True)
+        
+        print(f"✓ YOLOv8 model loaded from: {model_path}")
+        return YOLO(model_path)
+    
+    # Packages each export format needs to build and run the exported model
+    EXPORT_PACKAGES = {
+        "engine": ("tensorrt", "onnx"),
+        "openvino": ("openvino",)
+    }
+    
+    @staticmethod
+    def _missing_packages(names) -> List[str]:
+        """Names from `names` that cannot be imported (checked without importing)"""
+        return [name for name in names if importlib.util.find_spec(name) is None]
+    
+    def _build_calibration_data(self, model_path: str) -> bool:
+        """
+        Sample INT8 calibration frames from the camera videos
+        
+        Writes INT8_CALIBRATION_FRAMES frames, spread evenly over every
+        VIDEO_SOURCES video, as JPEGs next to INT8_CALIBRATION_DATA and the
+        dataset YAML pointing at them (the directory is removed again if
+        the INT8 export fails).
+        
+        Args:
+            model_path: Path to YOLOv8 model file (for the class names)
+            
+        Returns:
+            True if calibration data was written
+        """
+        data_dir = os.path.dirname(INT8_CALIBRATION_DATA)
+        image_dir = os.path.join(data_dir, "calib_images")
+        os.makedirs(image_dir, exist_ok=True)
+        print(f"Sampling INT8 calibration frames into: {data_dir}")
+        
+        per_source = max(1, INT8_CALIBRATION_FRAMES // len(VIDEO_SOURCES))
+        written = 0
+        
+        for side, source in VIDEO_SOURCES.items():
+            cap = cv2.VideoCapture(source)
+            total = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+            
+            for i in range(per_source):
+                if total > 0:
+                    cap.set(cv2.CAP_PROP_POS_FRAMES, i * total // per_source)
+                ret, frame = cap.read()
+                if not ret:
+                    break
+                cv2.imwrite(os.path.join(image_dir, f"{side.lower()}_{i:03d}.jpg"), frame)
+                written += 1
+            
+            cap.release()
+        
+        if not written:
+            print("✗ No video frames for INT8 calibration, keeping FP16/FP32")
+            shutil.rmtree(data_dir, ignore_errors=True)
+            return False
+        
+        # Ultralytics dataset YAML (images only - calibration needs no labels)
+        with open(INT8_CALIBRATION_DATA, 'w', encoding='utf-8') as f:
+            f.write(f"path: {data_dir}\n"
+                    f"train: calib_images\n"
+                    f"val: calib_images\n"
+                    f"names:\n")
+            for class_id, name in YOLO(model_path).names.items():
+                f.write(f"  {class_id}: {name}\n")
+        
+        print(f"✓ INT8 calibration data: {written} frames from {len(VIDEO_SOURCES)} videos")
+        return True
+    
     def detect_vehicles(self, frame: np.ndarray) -> Dict[str, any]:
         """
         Detect vehicles in a single frame
@@ -55,132 +274,426 @@ class VehicleDetector:
                 - trucks: Number of trucks/buses detected
                 - motorcycles: Number of motorcycles detected
                 - emergency: Boolean indicating emergency vehicle presence
-                - detections: List of detection boxes for visualization
+                - boxes: (N, 4) int32 box corners [x1, y1, x2, y2] for visualization
+                - box_types: (N,) uint8 box type per box (index into TYPE_LABELS)
+                - box_confidences: (N,) float32 confidence per box
         """
-        results = {
-            "total_vehicles": 0,
-            "cars": 0,
-            "trucks": 0,
-            "motorcycles": 0,
-            "emergency": False,
-            "detections": []
-        }
+        # Unrelated frames share no camera, so the motion gate must not
+        # hand one frame the result of another
+        return self.detect_vehicles_batch({"frame": frame}, gate=False)["frame"]
+    
+    def detect_vehicles_batch(self, frames: Dict[str, np.ndarray],
+                              gate: bool = True) -> Dict[str, Dict[str, any]]:
+        """
+        Detect vehicles in several frames with a single batched YOLO call
         
-        if frame is None or frame.size == 0:
-            return results
+        Args:
+            frames: Dictionary mapping side names to frames (BGR format)
+            gate: Reuse a side's last result while its view is static
+                  (frames must be consecutive frames of each side's camera)
+            
+        Returns:
+            Dictionary mapping side names to detection results
+            (same format as detect_vehicles)
+        """
+        batch_results = {side: self._empty_results() for side in frames}
+        
+        sides = [side for side, frame in frames.items()
+                 if frame is not None and frame.size > 0]
+        
+        # Sides whose view barely changed reuse their last result
+        thumbnails = {}
+        if gate:
+            sides, thumbnails = self._skip_static(frames, sides, batch_results)
+        if not sides:
+            return batch_results
         
         try:
-            # Run YOLO detection
-            yolo_results = self.model(frame, stream=True, verbose=False)
+            # Letterbox to the model size here so YOLO gets small frames
+            if self.use_cuda:
+                images, geometry = self._to_cuda_batch([frames[side] for side in sides])
+            else:
+                letterboxed = [self._letterbox(frames[side]) for side in sides]
+                geometry = [(scale, pad) for _, scale, pad in letterboxed]
+                
+                # BGR->RGB, HWC->CHW and /255 in one pass over the pixels
+                # (instead of YOLO's separate flip, transpose and scale)
+                images = torch.from_numpy(cv2.dnn.blobFromImages(
+                    [image for image, _, _ in letterboxed], 1 / 255, swapRB=True
+                ))
+            
+            # Run YOLO detection on all frames in one forward pass
+            yolo_results = self.model(images,
+                                      verbose=False, imgsz=MODEL_IMGSZ, half=self.half,
+                                      classes=self.detect_class_ids,
+                                      conf=self.confidence_threshold)
             
-            for result in yolo_results:
-                boxes = result.boxes
+            # One device->host copy (one sync) for the boxes of every frame;
+            # each row is [x1, y1, x2, y2, conf, cls]
+            box_counts = [len(result.boxes) for result in yolo_results]
+            all_boxes = torch.cat([result.boxes.data for result in yolo_results]).cpu().numpy()
+            per_frame = np.split(all_boxes, np.cumsum(box_counts)[:-1])
+            
+            for side, data, (scale, pad) in zip(sides, per_frame, geometry):
+                self._count_boxes(data, batch_results[side], scale, pad)
                 
-                for box in boxes:
-                    # Extract box information
-                    cls = int(box.cls[0])
-                    conf = float(box.conf[0])
-                    coords = box.xyxy[0].cpu().numpy()  # [x1, y1, x2, y2]
-                    
-                    # Only process detections above confidence threshold
-                    if conf < self.confidence_threshold:
-                        continue
-                    
-                    # Count vehicles by type
-                    if cls == self.vehicle_classes["car"]:
-                        results["cars"] += 1
-                        results["total_vehicles"] += 1
-                        vehicle_type = "Car"
-                        
-                    elif cls in [self.vehicle_classes["truck"], 
-                                self.vehicle_classes["bus"]]:
-                        results["trucks"] += 1
-                        results["total_vehicles"] += 1
-                        vehicle_type = "Truck/Bus"
-                        
-                    elif cls == self.vehicle_classes["motorcycle"]:
-                        results["motorcycles"] += 1
-                        results["total_vehicles"] += 1
-                        vehicle_type = "Motorcycle"
-                        
-                    elif cls in self.emergency_classes.values():
-                        results["emergency"] = True
-                        vehicle_type = "EMERGENCY"
-                        
-                    else:
-                        continue
-                    
-                    # Store detection for visualization
-                    results["detections"].append({
-                        "coords": coords,
-                        "type": vehicle_type,
-                        "confidence": conf
-                    })
+                if side in thumbnails:
+                    self.static_refs[side] = (thumbnails[side], batch_results[side])
+                    self.static_skips[side] = 0
                     
         except Exception as e:
             print(f"Error in vehicle detection: {e}")
         
-        return results
+        return batch_results
+    
+    def _skip_static(self, frames: Dict[str, np.ndarray], sides: List[str],
+                     batch_results: Dict[str, Dict[str, any]]) -> Tuple[List[str], Dict]:
+        """
+        Drop sides whose view is static since their last detection
+        
+        A static side gets its last result dict itself (not a copy) put
+        into batch_results, so results must be treated as read-only.
+        
+        Args:
+            frames: Dictionary mapping side names to frames (BGR format)
+            sides: Sides with a usable frame
+            batch_results: Detection results to fill in for static sides
+            
+        Returns:
+            Tuple of (sides to run detection on, gray thumbnail per such side)
+        """
+        if MOTION_THRESHOLD <= 0:
+            return sides, {}
+        
+        moving, thumbnails = [], {}
+        for side in sides:
+            thumbnail = cv2.cvtColor(
+                cv2.resize(frames[side], MOTION_SIZE, interpolation=cv2.INTER_AREA),
+                cv2.COLOR_BGR2GRAY
+            )
+            reference = self.static_refs.get(side)
+            
+            if (reference is not None and self.static_skips[side] < MAX_STATIC_SKIPS
+                    and cv2.absdiff(thumbnail, reference[0]).mean() < MOTION_THRESHOLD):
+                self.static_skips[side] += 1
+                batch_results[side] = reference[1]
+            else:
+                moving.append(side)
+                thumbnails[side] = thumbnail
+        
+        return moving, thumbnails
+    
+    def _to_cuda_batch(self, frames: List[np.ndarray]) -> Tuple[torch.Tensor, List[Tuple]]:
+        """
+        Upload raw BGR frames and letterbox them into one normalized RGB BCHW
+        CUDA tensor
+        
+        Replaces all CPU preprocessing (resize, pad, BGR->RGB, HWC->CHW, /255
+        and the float upload) with one uint8 upload per frame and the rest on
+        the GPU.
+        
+        Args:
+            frames: Video frames (BGR format, any size)
+            
+        Returns:
+            Tuple of (float tensor of shape (N, 3, MODEL_IMGSZ, MODEL_IMGSZ) in
+            [0, 1], [(scale factor, padding)] per frame as in _letterbox)
+        """
+        batch = torch.full((len(frames), 3, MODEL_IMGSZ, MODEL_IMGSZ), 114 / 255,
+                           dtype=torch.float32, device="cuda")
+        geometry = []
+        
+        for i, frame in enumerate(frames):
+            if i == len(self.pinned_frames):
+                self.pinned_frames.append(None)
+            if self.pinned_frames[i] is None or self.pinned_frames[i].shape != frame.shape:
+                # Page-locked staging buffer so the upload can run asynchronously
+                self.pinned_frames[i] = torch.empty(frame.shape, dtype=torch.uint8).pin_memory()
+            
+            staging = self.pinned_frames[i]
+            np.copyto(staging.numpy(), frame)
+            
+            scale, new_w, new_h, pad_x, pad_y = self._letterbox_geometry(frame)
+            image = staging.to("cuda", non_blocking=True).permute(2, 0, 1)
+            
+            # "area" avoids aliasing on heavy downscales, like INTER_AREA;
+            # channel swap and /255 run on the small resized image, fused
+            # into the copy into the batch
+            resized = F.interpolate(image.unsqueeze(0).float(), size=(new_h, new_w),
+                                    mode="area" if scale < 0.5 else "bilinear")
+            torch.mul(resized[0].flip(0), 1 / 255,
+                      out=batch[i, :, pad_y:pad_y + new_h, pad_x:pad_x + new_w])
+            
+            geometry.append((scale, np.array([pad_x, pad_y, pad_x, pad_y], dtype=np.float32)))
+        
+        return batch, geometry
+    
+    def _letterbox_geometry(self, frame: np.ndarray) -> Tuple[float, int, int, int, int]:
+        """
+        Compute how a frame is scaled and padded to the square model input
+        
+        Args:
+            frame: Input video frame
+            
+        Returns:
+            Tuple of (scale factor, new width, new height, pad_x, pad_y)
+        """
+        height, width = frame.shape[:2]
+        scale = MODEL_IMGSZ / max(height, width)
+        new_w, new_h = int(round(width * scale)), int(round(height * scale))
+        return scale, new_w, new_h, (MODEL_IMGSZ - new_w) // 2, (MODEL_IMGSZ - new_h) // 2
+    
+    def _letterbox(self, frame: np.ndarray) -> Tuple[np.ndarray, float, np.ndarray]:
+        """
+        Resize and pad a frame to the square model input size
+        
+        Args:
+            frame: Input video frame (BGR format)
+            
+        Returns:
+            Tuple of (letterboxed image, scale factor, [pad_x, pad_y, pad_x, pad_y])
+        """
+        scale, new_w, new_h, pad_x, pad_y = self._letterbox_geometry(frame)
+        
+        # INTER_AREA avoids aliasing on heavy downscales (e.g. 4K -> 640)
+        interpolation = cv2.INTER_AREA if scale < 0.5 else cv2.INTER_LINEAR
+        resized = cv2.resize(frame, (new_w, new_h), interpolation=interpolation)
+        
+        image = cv2.copyMakeBorder(resized, pad_y, MODEL_IMGSZ - new_h - pad_y,
+                                   pad_x, MODEL_IMGSZ - new_w - pad_x,
+                                   cv2.BORDER_CONSTANT, value=(114, 114, 114))
+        
+        return image, scale, np.array([pad_x, pad_y, pad_x, pad_y], dtype=np.float32)
+    
+    def _empty_results(self) -> Dict[str, any]:
+        """Get a zeroed detection result"""
+        return {
+            "total_vehicles": 0,
+            "cars": 0,
+            "trucks": 0,
+            "motorcycles": 0,
+            "emergency": False,
+            "boxes": np.empty((0, 4), dtype=np.int32),
+            "box_types": np.empty(0, dtype=np.uint8),
+            "box_confidences": np.empty(0, dtype=np.float32)
+        }
+    
+    # Box types: codes, the label drawn for each and its box color/thickness
+    TYPE_CAR, TYPE_TRUCK, TYPE_MOTORCYCLE, TYPE_EMERGENCY, TYPE_NONE = range(5)
+    TYPE_LABELS = ("Car", "Truck/Bus", "Motorcycle", "EMERGENCY", "")
+    TYPE_STYLES = (
+        ((0, 255, 0), 2),    # Green for cars
+        ((255, 165, 0), 2),  # Orange for trucks
+        ((255, 255, 0), 2),  # Cyan for motorcycles
+        ((0, 0, 255), 3),    # Red for emergency
+    )
+    
+    def _count_boxes(self, data: np.ndarray, results: Dict[str, any],
+                     scale: float, pad: np.ndarray):
+        """
+        Count and collect the vehicle boxes of one YOLO result
+        
+        Args:
+            data: Host copy of Boxes.data for one letterboxed frame
+                  ([x1, y1, x2, y2, conf, cls] per row)
+            results: Detection result dictionary to fill in
+            scale: Letterbox scale factor of the frame
+            pad: Letterbox padding as [pad_x, pad_y, pad_x, pad_y]
+        """
+        # YOLO already dropped low-confidence boxes and other classes
+        box_types = self.class_types[data[:, -1].astype(np.intp)]
+        conf_arr = data[:, -2]
+        coords_arr = (data[:, :4] - pad) / scale  # back to original frame pixels
+        
+        # Count vehicles by type
+        counts = np.bincount(box_types, minlength=len(self.TYPE_LABELS))
+        cars = int(counts[self.TYPE_CAR])
+        trucks = int(counts[self.TYPE_TRUCK])
+        motorcycles = int(counts[self.TYPE_MOTORCYCLE])
+        
+        results["cars"] += cars
+        results["trucks"] += trucks
+        results["motorcycles"] += motorcycles
+        results["total_vehicles"] += cars + trucks + motorcycles
+        results["emergency"] = results["emergency"] or bool(counts[self.TYPE_EMERGENCY])
+        
+        # Store detections for visualization (one array per field)
+        matched = box_types != self.TYPE_NONE
+        results["boxes"] = coords_arr[matched].astype(np.int32)
+        results["box_types"] = box_types[matched].astype(np.uint8)
+        results["box_confidences"] = conf_arr[matched].astype(np.float32)
     
     def draw_detections(self, frame: np.ndarray, 
-                       detections: List[Dict]) -> np.ndarray:
+                       vehicle_data: Dict[str, any], in_place: bool = False) -> np.ndarray:
         """
         Draw bounding boxes and labels on frame
         
         Args:
             frame: Input frame
-            detections: List of detection dictionaries
+            vehicle_data: Detection result (boxes, box_types, box_confidences)
+            in_place: Draw on frame itself instead of a copy
             
         Returns:
-            Frame with drawn detections
+            Frame with drawn detections (unless in_place, the shared annotation
+            buffer - valid until the next annotation call)
         """
-        annotated_frame = frame.copy()
+        annotated_frame = frame if in_place else self._annotation_copy(frame)
         
-        for detection in detections:
-            coords = detection["coords"]
-            vehicle_type = detection["type"]
-            confidence = detection["confidence"]
-            
-            x1, y1, x2, y2 = map(int, coords)
-            
+        for (x1, y1, x2, y2), box_type, confidence in zip(
+                vehicle_data["boxes"].tolist(),
+                vehicle_data["box_types"].tolist(),
+                vehicle_data["box_confidences"].tolist()):
             # Color based on vehicle type
-            if vehicle_type == "EMERGENCY":
-                color = (0, 0, 255)  # Red for emergency
-                thickness = 3
-            elif vehicle_type == "Truck/Bus":
-                color = (255, 165, 0)  # Orange for trucks
-                thickness = 2
-            elif vehicle_type == "Car":
-                color = (0, 255, 0)  # Green for cars
-                thickness = 2
-            else:
-                color = (255, 255, 0)  # Cyan for motorcycles
-                thickness = 2
+            color, thickness = self.TYPE_STYLES[box_type]
             
             # Draw bounding box
             cv2.rectangle(annotated_frame, (x1, y1), (x2, y2), 
                          color, thickness)
             
             # Draw label
-            label = f"{vehicle_type} {confidence:.2f}"
-            label_size, _ = cv2.getTextSize(label, cv2.FONT_HERSHEY_SIMPLEX, 
-                                           0.5, 1)
-            label_y = max(y1, label_size[1] + 10)
+            layer, label_height = self._get_label_layer(box_type, f"{confidence:.2f}")
+            label_y = max(y1, label_height + 10)
+            self._paste_layer(annotated_frame, layer,
+                              label_y - label_height - 10 - self.LABEL_MARGIN,
+                              x1 - self.LABEL_MARGIN)
+        
+        return annotated_frame
+    
+    def _annotation_copy(self, frame: np.ndarray) -> np.ndarray:
+        """
+        Copy a frame into the reused annotation buffer
+        
+        Args:
+            frame: Frame to annotate
             
-            cv2.rectangle(annotated_frame, 
-                         (x1, label_y - label_size[1] - 10),
-                         (x1 + label_size[0], label_y),
-                         color, -1)
+        Returns:
+            The annotation buffer holding a copy of frame
+        """
+        if self.annotation_buffer is None or self.annotation_buffer.shape != frame.shape:
+            self.annotation_buffer = np.empty_like(frame)
+        
+        np.copyto(self.annotation_buffer, frame)
+        return self.annotation_buffer
+    
+    # Stats overlay rows: (label, baseline y, font scale, color, thickness, count key)
+    HUD_ROWS = [
+        ("Total Vehicles: ", 65, 0.6, (255, 255, 255), 1, 'total_vehicles'),
+        ("Cars: ", 90, 0.5, (0, 255, 0), 1, 'cars'),
+        ("Trucks/Buses: ", 115, 0.5, (255, 165, 0), 1, 'trucks'),
+        ("Motorcycles: ", 140, 0.5, (255, 255, 0), 1, 'motorcycles')
+    ]
+    EMERGENCY_TEXT = "! EMERGENCY VEHICLE DETECTED !"
+    
+    # Blank border around a detection label's canvas (text may overhang the box)
+    LABEL_MARGIN = 10
+    
+    def _render_layer(self, height: int, width: int, draw) -> Tuple:
+        """
+        Render static drawing once as a premultiplied color layer plus coverage
+        
+        Args:
+            height, width: Canvas size
+            draw: Callable(image, fill) issuing the cv2 draw calls; fill
+                  replaces the colors when rendering the coverage mask
             
-            cv2.putText(annotated_frame, label, 
-                       (x1, label_y - 5),
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 0, 0), 1)
+        Returns:
+            (color drawn on black, 255 - coverage, top, left), cropped to the
+            drawn pixels
+        """
+        color = np.zeros((height, width, 3), dtype=np.uint8)
+        coverage = np.zeros((height, width), dtype=np.uint8)
+        draw(color, None)
+        draw(coverage, 255)
         
-        return annotated_frame
+        x, y, w, h = cv2.boundingRect(coverage)
+        inv_coverage = cv2.cvtColor(255 - coverage[y:y + h, x:x + w], cv2.COLOR_GRAY2BGR)
+        return color[y:y + h, x:x + w].copy(), inv_coverage, y, x
+    
+    def _get_hud_layer(self, side_name: str) -> Tuple:
+        """Static labels of the stats overlay for one side (rendered on first use)"""
+        layer = self.hud_layers.get(side_name)
+        if layer is None:
+            def draw(image, fill):
+                cv2.putText(image, f"{side_name} SIDE", (20, 35),
+                           cv2.FONT_HERSHEY_SIMPLEX, 0.7, fill or (255, 255, 255), 2)
+                for label, y, scale, color, thickness, _ in self.HUD_ROWS:
+                    cv2.putText(image, label, (20, y),
+                               cv2.FONT_HERSHEY_SIMPLEX, scale, fill or color, thickness)
+            
+            layer = self._render_layer(160, 320, draw)
+            self.hud_layers[side_name] = layer
+        return layer
+    
+    def _get_emergency_layer(self) -> Tuple:
+        """Emergency banner (rows height-50..height-10 of the frame), rendered once"""
+        if self.emergency_layer is None:
+            text_width = cv2.getTextSize(self.EMERGENCY_TEXT,
+                                         cv2.FONT_HERSHEY_SIMPLEX, 0.6, 2)[0][0]
+            
+            def draw(image, fill):
+                cv2.rectangle(image, (10, 0), (300, 40), fill or (0, 0, 255), -1)
+                cv2.putText(image, self.EMERGENCY_TEXT, (20, 25),
+                           cv2.FONT_HERSHEY_SIMPLEX, 0.6, fill or (255, 255, 255), 2)
+            
+            self.emergency_layer = self._render_layer(41, max(301, text_width + 30), draw)
+        return self.emergency_layer
+    
+    def _get_label_layer(self, box_type: int, confidence_text: str) -> Tuple:
+        """
+        Detection label for one type and confidence (rendered on first use)
+        
+        Returns:
+            (layer, text height); the label's bottom-left corner sits at
+            (LABEL_MARGIN, LABEL_MARGIN + text height + 10) of the layer canvas
+        """
+        key = (box_type, confidence_text)
+        cached = self.label_layers.get(key)
+        if cached is None:
+            label = f"{self.TYPE_LABELS[box_type]} {confidence_text}"
+            (text_width, text_height), _ = cv2.getTextSize(
+                label, cv2.FONT_HERSHEY_SIMPLEX, 0.5, 1)
+            color = self.TYPE_STYLES[box_type][0]
+            margin = self.LABEL_MARGIN
+            
+            def draw(image, fill):
+                cv2.rectangle(image, (margin, margin),
+                             (margin + text_width, margin + text_height + 10),
+                             fill or color, -1)
+                cv2.putText(image, label, (margin, margin + text_height + 5),
+                           cv2.FONT_HERSHEY_SIMPLEX, 0.5, fill or (0, 0, 0), 1)
+            
+            cached = (self._render_layer(text_height + 10 + 2 * margin,
+                                         text_width + 2 * margin, draw),
+                      text_height)
+            self.label_layers[key] = cached
+        return cached
+    
+    def _paste_layer(self, frame: np.ndarray, layer: Tuple, top: int, left: int = 0):
+        """
+        Blend a pre-rendered layer into frame, clipped to the frame
+        
+        Args:
+            frame: Frame to draw on (modified in place)
+            layer: Layer from _render_layer
+            top, left: Frame position of the layer canvas's top-left corner
+        """
+        color, inv_coverage, layer_top, layer_left = layer
+        top += layer_top
+        left += layer_left
+        skip_y = max(0, -top)
+        skip_x = max(0, -left)
+        rows = min(color.shape[0], frame.shape[0] - top)
+        cols = min(color.shape[1], frame.shape[1] - left)
+        if rows <= skip_y or cols <= skip_x:
+            return
+        
+        region = frame[top + skip_y:top + rows, left + skip_x:left + cols]
+        blended = cv2.multiply(region, inv_coverage[skip_y:rows, skip_x:cols], scale=1 / 255)
+        region[:] = cv2.add(blended, color[skip_y:rows, skip_x:cols])
     
     def add_stats_overlay(self, frame: np.ndarray, 
                          vehicle_counts: Dict[str, int],
-                         side_name: str) -> np.ndarray:
+                         side_name: str, in_place: bool = False) -> np.ndarray:
         """
         Add vehicle count statistics overlay to frame
         
@@ -188,56 +701,31 @@ class VehicleDetector:
             frame: Input frame
             vehicle_counts: Dictionary with vehicle counts
             side_name: Name of the traffic side (NORTH, SOUTH, etc.)
+            in_place: Draw on frame itself instead of a copy
             
         Returns:
-            Frame with statistics overlay
+            Frame with statistics overlay (unless in_place, the shared
+            annotation buffer - valid until the next annotation call)
         """
-        overlay = frame.copy()
+        if not in_place:
+            frame = self._annotation_copy(frame)
         height, width = frame.shape[:2]
         
-        # Semi-transparent background for stats
-        cv2.rectangle(overlay, (10, 10), (300, 150), 
-                     (0, 0, 0), -1)
-        frame = cv2.addWeighted(overlay, 0.6, frame, 0.4, 0)
-        
-        # Add text information
-        y_offset = 35
-        cv2.putText(frame, f"{side_name} SIDE", (20, y_offset),
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
-        
-        y_offset += 30
-        total = vehicle_counts.get('total_vehicles', 0)
-        cv2.putText(frame, 
-                   f"Total Vehicles: {total}", 
-                   (20, y_offset),
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 1)
-        
-        y_offset += 25
-        cars = vehicle_counts.get('cars', 0)
-        cv2.putText(frame, f"Cars: {cars}", 
-                   (20, y_offset),
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 1)
-        
-        y_offset += 25
-        trucks = vehicle_counts.get('trucks', 0)
-        cv2.putText(frame, f"Trucks/Buses: {trucks}", 
-                   (20, y_offset),
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 165, 0), 1)
-        
-        y_offset += 25
-        bikes = vehicle_counts.get('motorcycles', 0)
-        cv2.putText(frame, 
-                   f"Motorcycles: {bikes}", 
-                   (20, y_offset),
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 0), 1)
+        # Semi-transparent background for stats (60% black over the box only;
+        # blending with black is a plain 0.4 scale)
+        stats_box = frame[10:151, 10:301]
+        cv2.convertScaleAbs(stats_box, dst=stats_box, alpha=0.4)
+        
+        # Static labels are pre-rendered; only the numbers are drawn per frame
+        self._paste_layer(frame, self._get_hud_layer(side_name), 0)
+        
+        for (_, y, scale, color, thickness, key), x in zip(self.HUD_ROWS, self.hud_value_x):
+            cv2.putText(frame, str(vehicle_counts.get(key, 0)), (x, y),
+                       cv2.FONT_HERSHEY_SIMPLEX, scale, color, thickness)
         
         # Emergency indicator
         if vehicle_counts.get('emergency', False):
-            cv2.rectangle(frame, (10, height - 50), (300, height - 10),
-                         (0, 0, 255), -1)
-            cv2.putText(frame, "! EMERGENCY VEHICLE DETECTED !", 
-                       (20, height - 25),
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
+            self._paste_layer(frame, self._get_emergency_layer(), height - 50)
         
         return frame
 
@@ -5,15 +5,14 @@ Handles multiple video feeds from all four traffic sides
 
 import cv2
 import threading
-import queue
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 import time
 import sys
 import os
 
 # Add parent directory to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from config import VIDEO_SOURCES, FRAME_SKIP
+from config import VIDEO_SOURCES, FRAME_SKIP, HW_VIDEO_DECODE, VIDEO_FPS
 
 
 class VideoManager:
@@ -32,12 +31,16 @@ class VideoManager:
         self.video_sources = video_sources
         self.captures = {}
         self.current_frames = {}
-        self.frame_queues = {}
+        self.frame_lock = threading.Lock()
         self.running = False
         self.threads = {}
         self.frame_skip = FRAME_SKIP
         self.frame_counts = {side: 0 for side in video_sources.keys()}
         
+        # Set whenever any side stores a new frame (lets consumers block
+        # instead of polling)
+        self.new_frame_event = threading.Event()
+        
         # Initialize video captures
         self._initialize_captures()
     
@@ -52,11 +55,13 @@ class VideoManager:
                 print(f"✗ {side}: Video not found at {video_path}")
                 continue
             
-            cap = cv2.VideoCapture(video_path)
+            cap = self._open_capture(video_path)
             
             if cap.isOpened():
+                # Keep only the newest frame in the driver queue
+                cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+                
                 self.captures[side] = cap
-                self.frame_queues[side] = queue.Queue(maxsize=10)
                 
                 # Get video properties
                 fps = cap.get(cv2.CAP_PROP_FPS)
@@ -76,6 +81,27 @@ class VideoManager:
         
         print(f"\n✓ Successfully loaded {len(self.captures)}/4 video sources\n")
     
+    def _open_capture(self, video_path: str) -> cv2.VideoCapture:
+        """
+        Open a video file, preferring hardware-accelerated FFMPEG decoding
+        
+        Args:
+            video_path: Path to the video file
+            
+        Returns:
+            VideoCapture object (software-decoded if acceleration is unavailable)
+        """
+        if HW_VIDEO_DECODE and hasattr(cv2, "CAP_PROP_HW_ACCELERATION"):
+            # Acceleration has to be requested at open time, cap.set() is ignored
+            cap = cv2.VideoCapture(video_path, cv2.CAP_FFMPEG, [
+                cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY
+            ])
+            if cap.isOpened():
+                return cap
+            cap.release()
+        
+        return cv2.VideoCapture(video_path)
+    
     def start(self):
         """Start video capture threads for all sides"""
         self.running = True
@@ -99,8 +125,21 @@ class VideoManager:
         cap = self.captures[side]
         frame_counter = 0
         
+        # Play the file at its own frame rate rather than as fast as it decodes
+        fps = cap.get(cv2.CAP_PROP_FPS)
+        frame_interval = 1.0 / (fps if fps > 0 else VIDEO_FPS)
+        next_grab = time.monotonic()
+        
         while self.running:
-            ret, frame = cap.read()
+            now = time.monotonic()
+            if now < next_grab:
+                time.sleep(next_grab - now)
+            # Fell behind (e.g. a slow decode): resume pacing from now
+            next_grab = max(next_grab + frame_interval, now)
+            
+            # Demuxes and decodes the next frame; retrieve() below only
+            # converts the kept ones to BGR
+            ret = cap.grab()
             
             # Loop video when it ends
             if not ret:
@@ -112,19 +151,16 @@ class VideoManager:
             if frame_counter % self.frame_skip != 0:
                 continue
             
-            # Store frame
-            self.current_frames[side] = frame
-            self.frame_counts[side] += 1
-            
-            # Put frame in queue (non-blocking)
-            try:
-                if not self.frame_queues[side].full():
-                    self.frame_queues[side].put(frame, block=False)
-            except queue.Full:
-                pass
+            ret, frame = cap.retrieve()
+            if not ret:
+                continue
             
-            # Small delay to control frame rate
-            time.sleep(0.001)
+            # Overwrite the latest-frame slot; the frame count doubles as
+            # the frame id
+            with self.frame_lock:
+                self.current_frames[side] = frame
+                self.frame_counts[side] += 1
+            self.new_frame_event.set()
     
     def get_frame(self, side: str) -> Optional[cv2.Mat]:
         """
@@ -136,7 +172,8 @@ class VideoManager:
         Returns:
             Latest frame or None if not available
         """
-        return self.current_frames.get(side, None)
+        with self.frame_lock:
+            return self.current_frames.get(side, None)
     
     def get_all_frames(self) -> Dict[str, cv2.Mat]:
         """
@@ -145,7 +182,34 @@ class VideoManager:
         Returns:
             Dictionary mapping side names to frames
         """
-        return self.current_frames.copy()
+        with self.frame_lock:
+            return self.current_frames.copy()
+    
+    def get_all_frames_with_ids(self) -> Dict[str, Tuple[cv2.Mat, int]]:
+        """
+        Get latest frames from all sides with their frame ids
+        
+        Returns:
+            Dictionary mapping side names to (frame, frame_id); the id grows
+            by one with every new frame of that side
+        """
+        with self.frame_lock:
+            return {side: (frame, self.frame_counts[side])
+                    for side, frame in self.current_frames.items()}
+    
+    def wait_for_frames(self, timeout: float) -> bool:
+        """
+        Block until any side has a new frame
+        
+        Args:
+            timeout: Maximum wait in seconds
+            
+        Returns:
+            True if a new frame arrived, False on timeout
+        """
+        arrived = self.new_frame_event.wait(timeout)
+        self.new_frame_event.clear()
+        return arrived
     
     def stop(self):
         """Stop all video capture threads"""
@@ -5,12 +5,77 @@ Tracks all system events, vehicle counts, and signal changes
 
 import csv
 import os
+import queue
+import threading
+import time
 from datetime import datetime
 from typing import Dict, Any
 import sys
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from config import ENABLE_LOGGING, LOG_FILE, CSV_LOG_FILE
+from config import (
+    ENABLE_LOGGING, LOG_FILE, CSV_LOG_FILE, LOG_FLUSH_ROWS, LOG_FLUSH_INTERVAL
+)
+
+
+class ConsolePrinter:
+    """
+    Prints status messages from a background thread so the control loop
+    never blocks on a slow terminal or pipe
+    """
+    
+    def __init__(self, max_pending: int = 4096):
+        """
+        Initialize printer (the thread starts on first use)
+        
+        Args:
+            max_pending: Messages queued before new ones are dropped
+        """
+        self.queue = queue.Queue(maxsize=max_pending)
+        self.thread = None
+        self.start_lock = threading.Lock()
+    
+    def print(self, message: str):
+        """
+        Queue a message for printing (never blocks)
+        
+        Args:
+            message: Text to print (a newline is added)
+        """
+        if self.thread is None:
+            with self.start_lock:
+                if self.thread is None:
+                    self.thread = threading.Thread(target=self._drain, daemon=True)
+                    self.thread.start()
+        
+        try:
+            self.queue.put_nowait(message)
+        except queue.Full:
+            pass  # Console is not keeping up - drop the message
+    
+    def _drain(self):
+        """Write queued messages to stdout, all pending ones in one write"""
+        while True:
+            lines = [self.queue.get()]
+            while True:
+                try:
+                    lines.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            sys.stdout.write("\n".join(lines) + "\n")
+            sys.stdout.flush()
+            for _ in lines:
+                self.queue.task_done()
+    
+    def flush(self):
+        """Wait until every queued message has been printed"""
+        if self.thread is not None:
+            self.queue.join()
+
+
+# Shared printer for messages from the processing thread
+console = ConsolePrinter()
 
 
 class TrafficLogger:
@@ -30,8 +95,18 @@ class TrafficLogger:
         self.csv_file = csv_file
         self.enabled = ENABLE_LOGGING
         
+        # Lines and rows are handed to a writer thread, which appends them
+        # in batches
+        self.pending = queue.SimpleQueue()
+        self.writer_thread = None
+        
+        # Last formatted timestamp and the second it is for
+        self.timestamp_cache = (None, "")
+        
         if self.enabled:
             self._initialize_files()
+            self.writer_thread = threading.Thread(target=self._write_loop, daemon=True)
+            self.writer_thread.start()
     
     def _initialize_files(self):
         """Initialize log files with headers"""
@@ -65,8 +140,59 @@ class TrafficLogger:
         print(f"✓ Logger initialized: {os.path.basename(self.log_file)}")
     
     def _get_timestamp(self) -> str:
-        """Get formatted timestamp"""
-        return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        """Get formatted timestamp (formatted once per second)"""
+        second = int(time.time())
+        cached_second, timestamp = self.timestamp_cache
+        if second != cached_second:
+            timestamp = datetime.fromtimestamp(second).strftime("%Y-%m-%d %H:%M:%S")
+            self.timestamp_cache = (second, timestamp)
+        return timestamp
+    
+    def _write_loop(self):
+        """
+        Writer thread: collect lines/rows and append them in batches
+        
+        Both files stay open for the whole session; a batch is one buffered
+        write and one flush per file.
+        """
+        lines, rows = [], []
+        deadline = time.monotonic() + LOG_FLUSH_INTERVAL
+        stopping = False
+        
+        with open(self.log_file, 'a', encoding='utf-8') as log_f, \
+                open(self.csv_file, 'a', newline='', encoding='utf-8') as csv_f:
+            csv_writer = csv.writer(csv_f)
+            
+            while not stopping:
+                try:
+                    item = self.pending.get(timeout=max(0.0, deadline - time.monotonic()))
+                    if item is None:
+                        stopping = True
+                    else:
+                        kind, entry = item
+                        (lines if kind == "log" else rows).append(entry)
+                except queue.Empty:
+                    pass
+                
+                if (stopping or len(lines) + len(rows) >= LOG_FLUSH_ROWS
+                        or time.monotonic() >= deadline):
+                    if lines:
+                        log_f.writelines(lines)
+                        log_f.flush()
+                    if rows:
+                        csv_writer.writerows(rows)
+                        csv_f.flush()
+                    lines, rows = [], []
+                    deadline = time.monotonic() + LOG_FLUSH_INTERVAL
+    
+    def close(self):
+        """Write everything still pending and stop the writer thread"""
+        if self.writer_thread is None:
+            return
+        self.enabled = False
+        self.pending.put(None)
+        self.writer_thread.join()
+        self.writer_thread = None
     
     def log_event(self, event_type: str, message: str):
         """
@@ -81,9 +207,7 @@ class TrafficLogger:
         
         timestamp = self._get_timestamp()
         log_entry = f"[{timestamp}] [{event_type}] {message}\n"
-        
-        with open(self.log_file, 'a', encoding='utf-8') as f:
-            f.write(log_entry)
+        self.pending.put(("log", log_entry))
     
     def log_signal_change(self, change_info: Dict[str, Any]):
         """
@@ -109,21 +233,19 @@ class TrafficLogger:
         self.log_event("SIGNAL", message)
         
         # CSV log
-        with open(self.csv_file, 'a', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow([
-                timestamp,
-                'SIGNAL_CHANGE',
-                change_info['to_side'],
-                'GREEN',
-                '',
-                '',
-                '',
-                '',
-                change_info.get('emergency', False),
-                f"{change_info.get('duration', 0):.1f}",
-                change_info.get('reason', '')
-            ])
+        self.pending.put(("csv", [
+            timestamp,
+            'SIGNAL_CHANGE',
+            change_info['to_side'],
+            'GREEN',
+            '',
+            '',
+            '',
+            '',
+            change_info.get('emergency', False),
+            f"{change_info.get('duration', 0):.1f}",
+            change_info.get('reason', '')
+        ]))
     
     def log_vehicle_count(self, side: str, vehicle_data: Dict[str, Any]):
         """
@@ -139,21 +261,19 @@ class TrafficLogger:
         timestamp = self._get_timestamp()
         
         # CSV log
-        with open(self.csv_file, 'a', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow([
-                timestamp,
-                'VEHICLE_COUNT',
-                side,
-                '',
-                vehicle_data.get('total_vehicles', 0),
-                vehicle_data.get('cars', 0),
-                vehicle_data.get('trucks', 0),
-                vehicle_data.get('motorcycles', 0),
-                vehicle_data.get('emergency', False),
-                '',
-                ''
-            ])
+        self.pending.put(("csv", [
+            timestamp,
+            'VEHICLE_COUNT',
+            side,
+            '',
+            vehicle_data.get('total_vehicles', 0),
+            vehicle_data.get('cars', 0),
+            vehicle_data.get('trucks', 0),
+            vehicle_data.get('motorcycles', 0),
+            vehicle_data.get('emergency', False),
+            '',
+            ''
+        ]))
     
     def log_emergency(self, side: str):
         """
@@ -174,12 +294,14 @@ class TrafficLogger:
     
     def log_system_stop(self):
         """Log system shutdown"""
-        self.log_event("SYSTEM", "Traffic system stopped")
+        if not self.enabled:
+            return
         
-        with open(self.log_file, 'a', encoding='utf-8') as f:
-            f.write("\n" + "="*80 + "\n")
-            f.write(f"Session Ended: {self._get_timestamp()}\n")
-            f.write("="*80 + "\n\n")
+        self.log_event("SYSTEM", "Traffic system stopped")
+        self.pending.put(("log", "\n" + "="*80 + "\n"
+                                 f"Session Ended: {self._get_timestamp()}\n"
+                                 + "="*80 + "\n\n"))
+        self.close()
     
     def get_log_path(self) -> str:
         """Get path to log file"""
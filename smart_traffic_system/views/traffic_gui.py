@@ -15,7 +15,7 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from config import (
     GUI_WIDTH, GUI_HEIGHT, VIDEO_DISPLAY_WIDTH, VIDEO_DISPLAY_HEIGHT,
-    SIGNAL_COLORS, SIGNAL_SEQUENCE
+    SIGNAL_COLORS, SIGNAL_SEQUENCE, PREVIEW_SKIP_THRESHOLD
 )
 from controllers.traffic_controller import SignalState
 
@@ -55,6 +55,27 @@ class TrafficGUI:
         # Statistics labels
         self.stats_labels = {}
         
+        # (text, color) last set per info/timer/status label
+        self.label_states = {}
+        
+        # GPU preview path (OpenCV built with CUDA, else an OpenCL GPU)
+        self.use_cuda = self._cuda_available()
+        self.gpu_frames = {}
+        self.use_opencl = not self.use_cuda and self._opencl_gpu_available()
+        
+        # Preview scratch buffers per side (resized BGR and RGB), reused every tick
+        self.preview_shape = (VIDEO_DISPLAY_HEIGHT, VIDEO_DISPLAY_WIDTH, 3)
+        self.resized_buffers = {}
+        self.rgb_buffers = {}
+        
+        # One PhotoImage per side, attached to its label once and repainted
+        # in place with paste() on every frame
+        self.photo_images = {}
+        
+        # Every 8th pixel of the frame each preview shows, to spot
+        # near-identical frames cheaply
+        self.preview_thumbs = {}
+        
         # Create GUI layout
         self._create_gui()
         
@@ -209,36 +230,102 @@ class TrafficGUI:
         )
         self.status_label.pack(fill=tk.BOTH, expand=True)
     
-    def update_video(self, side: str, frame: np.ndarray):
+    def update_video(self, side: str, frame: np.ndarray, skip_similar: bool = False):
         """
         Update video display for a specific side
         
         Args:
             side: Side name
             frame: Video frame (BGR format)
+            skip_similar: Keep the current preview if frame barely differs
+                          from it (see PREVIEW_SKIP_THRESHOLD)
         """
         if frame is None or side not in self.video_labels:
             return
         
         try:
-            # Resize frame to display size
-            frame_resized = cv2.resize(frame, 
-                                      (VIDEO_DISPLAY_WIDTH, VIDEO_DISPLAY_HEIGHT))
+            # Near-identical to the shown frame (idle traffic): keep the preview
+            if PREVIEW_SKIP_THRESHOLD > 0:
+                thumb = np.ascontiguousarray(frame[::8, ::8])
+                last = self.preview_thumbs.get(side)
+                if (skip_similar and last is not None and last.shape == thumb.shape
+                        and cv2.norm(thumb, last, cv2.NORM_L1)
+                        < PREVIEW_SKIP_THRESHOLD * thumb.size):
+                    return
+                self.preview_thumbs[side] = thumb
+            
+            # Area averaging avoids aliasing on large downscales; close to
+            # display size bilinear looks the same and is cheaper
+            interpolation = (cv2.INTER_AREA
+                             if frame.shape[1] > 1.5 * VIDEO_DISPLAY_WIDTH
+                             else cv2.INTER_LINEAR)
             
-            # Convert BGR to RGB
-            frame_rgb = cv2.cvtColor(frame_resized, cv2.COLOR_BGR2RGB)
+            # Frames are resized first so the color conversion only touches
+            # the small preview, not the full source frame
+            if self.use_cuda:
+                # Resize + convert on the GPU, download only the small preview
+                gpu_frame = self.gpu_frames.setdefault(side, cv2.cuda_GpuMat())
+                gpu_frame.upload(frame)
+                gpu_resized = cv2.cuda.resize(gpu_frame, 
+                                              (VIDEO_DISPLAY_WIDTH, VIDEO_DISPLAY_HEIGHT),
+                                              interpolation=interpolation)
+                frame_rgb = cv2.cuda.cvtColor(gpu_resized, cv2.COLOR_BGR2RGB).download()
+            elif self.use_opencl:
+                # Same on OpenCL through UMat (e.g. integrated GPUs)
+                umat_resized = cv2.resize(cv2.UMat(frame),
+                                          (VIDEO_DISPLAY_WIDTH, VIDEO_DISPLAY_HEIGHT),
+                                          interpolation=interpolation)
+                frame_rgb = cv2.cvtColor(umat_resized, cv2.COLOR_BGR2RGB).get()
+            else:
+                if side not in self.rgb_buffers:
+                    self.resized_buffers[side] = np.empty(self.preview_shape, np.uint8)
+                    self.rgb_buffers[side] = np.empty(self.preview_shape, np.uint8)
+                
+                # Resize frame to display size
+                frame_resized = cv2.resize(frame, 
+                                          (VIDEO_DISPLAY_WIDTH, VIDEO_DISPLAY_HEIGHT),
+                                          dst=self.resized_buffers[side],
+                                          interpolation=interpolation)
+                
+                # Convert BGR to RGB
+                frame_rgb = cv2.cvtColor(frame_resized, cv2.COLOR_BGR2RGB,
+                                         dst=self.rgb_buffers[side])
             
-            # Convert to PIL Image
-            img = Image.fromarray(frame_rgb)
-            imgtk = ImageTk.PhotoImage(image=img)
+            # Wrap as a PIL Image without copying (paste copies it into Tk)
+            img = Image.frombuffer("RGB", (VIDEO_DISPLAY_WIDTH, VIDEO_DISPLAY_HEIGHT),
+                                   frame_rgb, "raw", "RGB", 0, 1)
             
             # Update label
-            self.video_labels[side].imgtk = imgtk
-            self.video_labels[side].configure(image=imgtk)
+            imgtk = self.photo_images.get(side)
+            if imgtk is None:
+                imgtk = ImageTk.PhotoImage(image=img)
+                self.photo_images[side] = imgtk
+                self.video_labels[side].imgtk = imgtk
+                self.video_labels[side].configure(image=imgtk)
+            else:
+                imgtk.paste(img)
             
         except Exception as e:
             print(f"Error updating video for {side}: {e}")
     
+    def _cuda_available(self) -> bool:
+        """Check whether OpenCV has CUDA support and a usable device"""
+        try:
+            return cv2.cuda.getCudaEnabledDeviceCount() > 0
+        except (AttributeError, cv2.error):
+            return False
+    
+    def _opencl_gpu_available(self) -> bool:
+        """Check whether OpenCV's OpenCL (UMat) backend runs on a GPU device"""
+        try:
+            if not cv2.ocl.haveOpenCL():
+                return False
+            cv2.ocl.setUseOpenCL(True)
+            # An OpenCL CPU device would only add copies over the plain path
+            return bool(cv2.ocl.Device.getDefault().type() & cv2.ocl.DEVICE_TYPE_GPU)
+        except (AttributeError, cv2.error):
+            return False
+    
     def update_signal_state(self, side: str, state: SignalState):
         """
         Update signal light indicators
@@ -286,11 +373,11 @@ class TrafficGUI:
         
         if emergency:
             info_text += "\n! EMERGENCY!"
-            self.info_labels[side].configure(fg='#e74c3c')
+            color = '#e74c3c'
         else:
-            self.info_labels[side].configure(fg='#ecf0f1')
+            color = '#ecf0f1'
         
-        self.info_labels[side].configure(text=info_text)
+        self._configure_label(self.info_labels[side], info_text, color)
     
     def update_timer(self, side: str, time_remaining: float, is_active: bool):
         """
@@ -311,7 +398,7 @@ class TrafficGUI:
             timer_text = "Time: --s"
             color = '#7f8c8d'
         
-        self.timer_labels[side].configure(text=timer_text, fg=color)
+        self._configure_label(self.timer_labels[side], timer_text, color)
     
     def update_status(self, message: str, is_emergency: bool = False):
         """
@@ -322,10 +409,14 @@ class TrafficGUI:
             is_emergency: Whether this is an emergency status
         """
         if self.status_label:
-            self.status_label.configure(
-                text=f"Status: {message}",
-                fg='#e74c3c' if is_emergency else 'white'
-            )
+            self._configure_label(self.status_label, f"Status: {message}",
+                                  '#e74c3c' if is_emergency else 'white')
+    
+    def _configure_label(self, label: tk.Label, text: str, color: str):
+        """Set a label's text and color, skipping the Tk call if unchanged"""
+        if self.label_states.get(label) != (text, color):
+            self.label_states[label] = (text, color)
+            label.configure(text=text, fg=color)
     
     def get_root(self) -> tk.Tk:
         """Get root window"""